@@ -0,0 +1,71 @@
+"""Activity monitor — turns a stream of "heard from" notifications into
+active/idle transitions.
+
+Sources such as the FMS PLC (Modbus reads) and the sACN sender are considered
+active while they have been heard from within a timeout. Rather than polling
+that condition, the source calls notify() each time it is heard from and the
+monitor reports only the transitions: once on the event loop when it goes
+active, and once when the timeout lapses with no further activity.
+
+notify() only bumps a counter — no clock read per event. While active, a
+low-frequency tick (IDLE_TICKS per timeout) compares the counter against its
+previous value, so idle is reported between ``timeout`` and
+``timeout * (1 + 1 / IDLE_TICKS)`` after the last notification.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+IDLE_TICKS = 4  # quiet ticks in a row before the source is considered idle
+
+
+class ActivityMonitor:
+    def __init__(self, timeout: float) -> None:
+        """
+        Args:
+            timeout: Seconds without activity before the source is considered idle.
+        """
+        self._tick = timeout / IDLE_TICKS
+        self._active = False
+        self._count = 0  # notify() calls so far
+        self._seen = 0  # _count as of the last tick
+        self._quiet_ticks = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._on_change: Callable[[bool], None] | None = None
+
+    @property
+    def active(self) -> bool:
+        """The state most recently reported to the watcher."""
+        return self._active
+
+    def watch(self, loop: asyncio.AbstractEventLoop, on_change: Callable[[bool], None]) -> None:
+        """Call ``on_change(active)`` on ``loop`` whenever the source changes state."""
+        self._loop = loop
+        self._on_change = on_change
+
+    def notify(self) -> None:
+        """Record that the source was just heard from. Safe to call from any thread."""
+        self._count += 1
+        if not self._active and self._loop is not None:
+            self._active = True
+            self._loop.call_soon_threadsafe(self._went_active)
+
+    def _went_active(self) -> None:
+        self._seen = self._count
+        self._quiet_ticks = 0
+        self._on_change(True)
+        self._loop.call_later(self._tick, self._check_idle)
+
+    def _check_idle(self) -> None:
+        if self._count != self._seen:
+            self._seen = self._count
+            self._quiet_ticks = 0
+        else:
+            self._quiet_ticks += 1
+            if self._quiet_ticks >= IDLE_TICKS:
+                self._active = False
+                self._on_change(False)
+                return
+        self._loop.call_later(self._tick, self._check_idle)
@@ -8,21 +8,29 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
+import os
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import uvicorn
 
 from src.config import (
+    MOTOR_COIL_BASE,
+    MOTOR_PINS,
     MOTOR_SPEED,
     NT_SERVER_ADDRESS,
     STATE_FILE,
+    THRESHOLD_ENERGIZED,
+    THRESHOLD_SUPERCHARGED,
     WEB_HOST,
     WEB_PORT,
     HubConfig,
 )
+from src.web import server as web_server
 
 if TYPE_CHECKING:
     from src.ball_counter import BallCounterProtocol
@@ -34,21 +42,71 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-
-@dataclass
+# Mode and FMS period names. Interned, and every stored value is interned too
+# (see set_mode/_load_state/_teleop_status_task), so the hot-path comparisons
+# below resolve on CPython's identity check instead of comparing characters.
+MODE_FMS = sys.intern("fms")
+MODE_DEMO = sys.intern("demo")
+MODE_TELEOP = sys.intern("robot_teleop")
+MODE_PRACTICE = sys.intern("robot_practice")
+ROBOT_MODES = (MODE_TELEOP, MODE_PRACTICE)
+PERIOD_AUTO = sys.intern("auto")
+PERIOD_TELEOP = sys.intern("teleop")
+PERIOD_DISABLED = sys.intern("disabled")
+
+BROADCAST_COALESCE_S = 0.02  # state changes within this window share one broadcast
+DEMO_FLASH_S = 1.0  # demo-mode LEDs stay lit this long after the most recent ball
+COUNT_PUBLISH_COALESCE_S = 0.05  # balls within this window share one Modbus/NT write
+STATE_SAVE_COALESCE_S = 0.5  # settings edits within this window share one file write
+MOTOR_HEARTBEAT_S = 1.0  # motor inputs are re-evaluated this often in case a trigger is missed
+BLINK_INTERVAL_S = 0.25  # robot_practice end-of-cycle blink toggles at this interval (2 Hz)
+
+_T = TypeVar("_T")
+
+
+async def _wait_for_event(event: asyncio.Event, timeout: float | None) -> None:
+    """Wait until ``event`` is set or ``timeout`` seconds pass (None waits indefinitely)."""
+    try:
+        async with asyncio.timeout(timeout):
+            await event.wait()
+    except TimeoutError:
+        pass
+
+
+async def _get_or_shutdown(queue: asyncio.Queue[_T], shutdown: asyncio.Future) -> _T | None:
+    """Return the next item from ``queue``, or None once ``shutdown`` completes.
+
+    Waits on the queue and the shutdown future together instead of polling with
+    a timeout, so an idle consumer costs nothing until an item or shutdown arrives.
+    """
+    if not queue.empty():
+        return queue.get_nowait()
+    get_task = asyncio.ensure_future(queue.get())
+    try:
+        await asyncio.wait((get_task, shutdown), return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        get_task.cancel()
+        raise
+    if get_task.done():
+        return get_task.result()
+    get_task.cancel()
+    return None
+
+
+@dataclass(slots=True)
 class AppState:
-    mode: str = "demo"
+    mode: str = MODE_DEMO
     active_count: int = 0
     auto_count: int = 0
     inactive_count: int = 0
     nt_connected: bool = False
     modbus_active: bool = False
-    fms_period: str = "disabled"
+    fms_period: str = PERIOD_DISABLED
     hub_is_active: bool = True
     simulator_enabled: bool = False
     nt_server_address: str = NT_SERVER_ADDRESS
     sacn_active: bool = False
-    seconds_until_inactive: float = -1.0
+    seconds_until_inactive: int = -1  # whole seconds, -1 when no countdown
     motors_running: bool = False
     motor_speed: float = MOTOR_SPEED
     led_color: tuple[int, int, int] = (0, 0, 0)
@@ -73,13 +131,30 @@ class App:
         self._nt = nt_client
         self._sacn = sacn_receiver
 
+        # LED colours used on the scoring paths, built once instead of per ball/tick
+        from src.leds import Color
+
+        self._color_supercharged = Color(0, 207, 255)  # electric blue
+        self._color_energized = Color(255, 179, 0)  # amber
+        self._color_idle = Color(*hub.led_idle_color)
+        self._color_off = Color(0, 0, 0)
+
         self.state = AppState()
         self._ball_queue: asyncio.Queue[int] = asyncio.Queue()
         self._led_queue: asyncio.Queue[Color] = asyncio.Queue()
         self._shutdown_event = asyncio.Event()
+        self._dirty = asyncio.Event()  # set on any state change; drained by _broadcaster
+        self._last_state_json: bytes | None = None  # last state message sent to clients
+        self._ball_channel_json: dict[int, bytes] = {}  # one-ball ball_channel frame per channel
+        self._counts_dirty = asyncio.Event()  # set on each ball; drained by _count_publisher
+        self._save_dirty = asyncio.Event()  # set by _save_state; drained by _state_writer
+        self._practice_trigger = asyncio.Event()  # set on practice NT changes / mode changes
+        self._teleop_trigger = asyncio.Event()  # set on teleop NT changes / mode changes
+        self._motor_trigger = asyncio.Event()  # set on coil / NT throttle / manual / mode changes
         self._auto_grace_until: float = 0.0  # monotonic deadline for auto grace period
         self._hub_grace_until: float = 0.0   # monotonic deadline for hub-active grace period
-        self._demo_flash_task: asyncio.Task | None = None
+        self._flash_trigger = asyncio.Event()  # set by _handle_balls on each demo-mode batch
+        self._flash_deadline: float = 0.0  # monotonic time at which the demo flash ends
 
         self._load_state()
 
@@ -89,10 +164,17 @@ class App:
         loop = asyncio.get_running_loop()
 
         # Wire web server back-reference
-        from src.web import server as web_server
-
         web_server.app_instance = self
 
+        # Status changes are pushed by the subsystems rather than polled
+        self._nt.watch_practice(loop, self._practice_trigger)
+        self._nt.watch_teleop(loop, self._teleop_trigger)
+        self._nt.watch_motors(loop, self._motor_trigger)
+        self._modbus.watch_coils(loop, self._motor_trigger.set)
+        self._nt.watch_connection(loop, self._on_nt_connection)
+        self._modbus.watch_plc_active(loop, self._on_plc_active)
+        self._sacn.watch_active(loop, self._on_sacn_active)
+
         # Apply persisted mode
         await self._apply_mode(self.state.mode, loop)
 
@@ -109,9 +191,13 @@ class App:
         # Background tasks
         asyncio.create_task(self._process_balls())
         asyncio.create_task(self._process_leds())
-        asyncio.create_task(self._status_poll())
+        asyncio.create_task(self._teleop_status_task())
         asyncio.create_task(self._practice_led_task())
         asyncio.create_task(self._motor_poll())
+        asyncio.create_task(self._demo_flasher())
+        asyncio.create_task(self._broadcaster())
+        asyncio.create_task(self._count_publisher())
+        asyncio.create_task(self._state_writer())
 
         log.info("BearHub (%s) running — web at http://%s:%d", self.hub.name, WEB_HOST, WEB_PORT)
 
@@ -132,13 +218,15 @@ class App:
         self._sacn.stop()
         self._nt.stop()
         self._leds.clear()
+        self._leds.close()  # sends the clear frame before exit
         await self._modbus.stop()
-        self._save_state()
+        self._write_state(self._persisted_state())  # flush synchronously before exit
         log.info("Shutdown complete")
 
     # ── Mode management ──────────────────────────────────────────────────
 
     async def set_mode(self, mode: str) -> None:
+        mode = sys.intern(mode)
         if mode == self.state.mode:
             return
         log.info("Mode change: %s → %s", self.state.mode, mode)
@@ -146,305 +234,402 @@ class App:
 
         # Stop mode-specific subsystems
         old_mode = self.state.mode
-        if old_mode == "fms":
+        if old_mode == MODE_FMS:
             self._sacn.stop()
             await self._modbus.stop()
             self.state.modbus_active = False
-        if old_mode in ("robot_teleop", "robot_practice"):
+        if old_mode in ROBOT_MODES:
             self._nt.stop()
             self.state.nt_connected = False
 
         self.state.mode = mode
         await self._apply_mode(mode, loop)
         self._save_state()
-        await self._broadcast_state()
+        self._dirty.set()
 
     async def _apply_mode(self, mode: str, loop: asyncio.AbstractEventLoop) -> None:
-        if mode == "fms":
+        if mode == MODE_FMS:
             await self._modbus.start()
             try:
                 self._sacn.start(loop, self._led_queue)
             except Exception:
                 log.warning("sACN unavailable (dev machine?) — FMS LED control disabled")
-        elif mode in ("robot_teleop", "robot_practice"):
+        elif mode in ROBOT_MODES:
             try:
                 self._nt.start(self.state.nt_server_address, "bear-hub")
             except Exception:
                 log.warning("NT unavailable (dev machine?) — robot connection disabled")
-            self.state.nt_connected = False  # updated by poll
+            self.state.nt_connected = False  # kept current by the NT connection listener
 
         # Ball counter always active — stop first to release any previously claimed pins
         self._ball_counter.stop()
         self._ball_counter.start(loop, self._ball_queue)
+        # Let the NT-driven tasks re-evaluate the new mode
+        self._practice_trigger.set()
+        self._teleop_trigger.set()
+        self._motor_trigger.set()
 
     # ── Ball processing ──────────────────────────────────────────────────
 
     async def _process_balls(self) -> None:
-        while not self._shutdown_event.is_set():
-            try:
-                channel = await asyncio.wait_for(self._ball_queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-
-            # Broadcast raw channel event for debug page
-            from src.web.server import broadcast as _broadcast
-            await _broadcast({"type": "ball_channel", "channel": channel})
+        shutdown = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                channel = await _get_or_shutdown(self._ball_queue, shutdown)
+                if channel is None:
+                    break
+                # Drain everything already queued so a burst is scored as one batch
+                channels = [channel]
+                while not self._ball_queue.empty():
+                    channels.append(self._ball_queue.get_nowait())
+                await self._handle_balls(channels)
+        finally:
+            shutdown.cancel()
+
+    async def _handle_balls(self, channels: list[int]) -> None:
+        # Broadcast raw channel events for debug page — one frame per drained
+        # batch; single-ball frames, the common case, are encoded once and reused
+        if len(channels) == 1:
+            frames = self._ball_channel_json
+            channel = channels[0]
+            frame = frames.get(channel)
+            if frame is None:
+                message = {"type": "ball_channel", "channels": channels}
+                frame = frames[channel] = web_server.encode_message(message)
+        else:
+            frame = web_server.encode_message({"type": "ball_channel", "channels": channels})
+        await web_server.broadcast_bytes(frame)
 
-            mode = self.state.mode
-            if mode == "demo":
-                self.state.active_count += 1
+        balls = len(channels)
+        mode = self.state.mode
+        if mode == MODE_DEMO:
+            self.state.active_count += balls
+        else:
+            fms_period = self.state.fms_period
+            hub_active = self.state.hub_is_active
+            if fms_period == PERIOD_AUTO:
+                self.state.auto_count += balls
+                self.state.active_count += balls
+            elif not hub_active:
+                self.state.inactive_count += balls
             else:
-                fms_period = self.state.fms_period
-                hub_active = self.state.hub_is_active
-                if fms_period == "auto":
-                    self.state.auto_count += 1
-                    self.state.active_count += 1
-                elif not hub_active:
-                    self.state.inactive_count += 1
-                else:
-                    self.state.active_count += 1
-
-            # Publish to Modbus/NT
-            active_total = self.state.active_count
-            if mode == "fms":
-                fms_total = self.state.active_count + self.state.inactive_count
-                self._modbus.set_ball_count(self.hub.modbus_ball_count_register, fms_total)
-            elif mode in ("robot_teleop", "robot_practice"):
-                self._nt.publish_count(active_total)
-
-            # Update LEDs for local modes
-            if mode == "demo":
-                if self._demo_flash_task and not self._demo_flash_task.done():
-                    self._demo_flash_task.cancel()
-                self._demo_flash_task = asyncio.create_task(self._flash_demo_leds())
-            elif mode == "robot_teleop":
-                self._update_score_leds(active_total)
+                self.state.active_count += balls
 
-            await self._broadcast_state()
+        # Publish to Modbus/NT — coalesced by _count_publisher
+        active_total = self.state.active_count
+        if mode != MODE_DEMO:
+            self._counts_dirty.set()
 
-    # ── LED processing ───────────────────────────────────────────────────
+        # Update LEDs for local modes
+        if mode == MODE_DEMO:
+            self._flash_deadline = time.monotonic() + DEMO_FLASH_S
+            self._flash_trigger.set()
+        elif mode == MODE_TELEOP:
+            self._update_score_leds(active_total)
 
-    async def _process_leds(self) -> None:
+        self._dirty.set()
 
+    async def _count_publisher(self) -> None:
+        """Publish the ball count to Modbus/NT at most once per COUNT_PUBLISH_COALESCE_S.
+
+        The PLC polls far slower than balls can arrive, so a burst of balls only
+        needs its final total written once.
+        """
         while not self._shutdown_event.is_set():
-            try:
-                color = await asyncio.wait_for(self._led_queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-            self._leds.set_all(color)
-            self._leds.show()
-            new_color = (color.r, color.g, color.b)
-            if new_color != self.state.led_color:
+            await self._counts_dirty.wait()
+            await asyncio.sleep(COUNT_PUBLISH_COALESCE_S)
+            self._counts_dirty.clear()
+            self._publish_counts()
+
+    def _publish_counts(self) -> None:
+        mode = self.state.mode
+        if mode == MODE_FMS:
+            fms_total = self.state.active_count + self.state.inactive_count
+            self._modbus.set_ball_count(self.hub.modbus_ball_count_register, fms_total)
+        elif mode in ROBOT_MODES:
+            self._nt.publish_count(self.state.active_count)
+
+    # ── LED processing ───────────────────────────────────────────────────
+
+    async def _process_leds(self) -> None:
+        shutdown = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                color = await _get_or_shutdown(self._led_queue, shutdown)
+                if color is None:
+                    break
+                # Only the newest colour is visible — skip stale ones queued behind it
+                while not self._led_queue.empty():
+                    color = self._led_queue.get_nowait()
+                new_color = tuple(color)
+                if new_color == self.state.led_color:
+                    continue  # strip already shows this colour
+                self._leds.set_all(color)
+                self._leds.show()
                 self.state.led_color = new_color
-                await self._broadcast_state()
+                self._dirty.set()
+        finally:
+            shutdown.cancel()
 
     def _update_score_leds(self, count: int) -> None:
-        from src.config import THRESHOLD_ENERGIZED, THRESHOLD_SUPERCHARGED
-        from src.leds import Color
-
         if count >= THRESHOLD_SUPERCHARGED:
-            color = Color(0, 207, 255)  # electric blue
+            color = self._color_supercharged
         elif count >= THRESHOLD_ENERGIZED:
-            color = Color(255, 179, 0)  # amber
+            color = self._color_energized
         else:
-            r, g, b = self.hub.led_idle_color
-            color = Color(r, g, b)
-        self.state.led_color = (color.r, color.g, color.b)
+            color = self._color_idle
+        self.state.led_color = tuple(color)
         self._leds.set_all(color)
         self._leds.show()
 
-    async def _flash_demo_leds(self) -> None:
-        """Flash LEDs for 1 second on each ball scored in demo mode."""
-        from src.leds import Color
-        try:
+    async def _demo_flasher(self) -> None:
+        """Light LEDs until DEMO_FLASH_S after the most recent ball scored in demo mode.
+
+        A single long-lived task: each ball only pushes ``_flash_deadline`` out and
+        sets ``_flash_trigger``, so a burst of balls extends one flash instead of
+        creating and cancelling a task per ball.
+        """
+        while not self._shutdown_event.is_set():
+            await self._flash_trigger.wait()
             self.state.led_color = self.hub.led_idle_color
-            self._leds.set_all(Color(*self.hub.led_idle_color))
+            self._leds.set_all(self._color_idle)
             self._leds.show()
-            await self._broadcast_state()
-            await asyncio.sleep(1.0)
+            self._dirty.set()
+            while (remaining := self._flash_deadline - time.monotonic()) > 0:
+                await asyncio.sleep(remaining)
+            # Every trigger set during the flash has already extended the deadline
+            self._flash_trigger.clear()
             self.state.led_color = (0, 0, 0)
             self._leds.clear()
-            await self._broadcast_state()
-        except asyncio.CancelledError:
-            self.state.led_color = (0, 0, 0)
-            self._leds.clear()
-            raise
+            self._dirty.set()
 
     # ── Practice LED task ────────────────────────────────────────────────
 
     async def _practice_led_task(self) -> None:
-        """Drive LEDs in robot_practice mode at 250 ms resolution (2 Hz blink).
+        """Drive LEDs in robot_practice mode (2 Hz blink in the final 3 s of a cycle).
+
+        This task is the only reader of the practice NT topics: it resolves the
+        FMS period and hub-active state (with their 3 s grace periods) and the
+        inactive countdown, and publishes them into ``self.state`` for the
+        dashboard.
+
+        Rather than polling, it sleeps on ``_practice_trigger``, which the NT
+        client sets whenever a practice topic changes value and ``_apply_mode``
+        sets on every mode change. It also wakes on a timer only while something
+        time-based is pending: a blink toggle every 250 ms or a grace-period expiry.
 
         Writes to LEDs directly, bypassing the led_queue. The queue is only used
         in fms mode to receive sACN colours — the two paths never overlap because
         sACN is stopped and this task sleeps whenever the mode is not robot_practice.
         """
-        from src.leds import Color
+        # Loop invariants — bound once rather than re-resolved on every wake-up
+        nt = self._nt
+        leds = self._leds
+        state = self.state
+        trigger = self._practice_trigger
+        monotonic = time.monotonic
+        fms_auto = nt.FMS_CONTROL_DATA_AUTO
+        fms_teleop = nt.FMS_CONTROL_DATA_TELEOP
+        idle_color = self._color_idle
+        off = self._color_off
 
         blink_on = False
-        # Local grace-period timestamps give 250 ms resolution,
-        # independent of the 1 s _status_poll cycle.
-        auto_grace_until = 0.0
-        hub_grace_until = 0.0
+        next_toggle = 0.0  # monotonic time of the next blink toggle
 
         while not self._shutdown_event.is_set():
-            if self.state.mode != "robot_practice":
+            trigger.clear()
+            if state.mode != MODE_PRACTICE:
                 blink_on = False
-                auto_grace_until = 0.0
-                hub_grace_until = 0.0
-                await asyncio.sleep(0.25)
+                next_toggle = 0.0
+                self._auto_grace_until = 0.0
+                self._hub_grace_until = 0.0
+                # The countdown only exists in robot_practice — reset it elsewhere
+                if state.seconds_until_inactive != -1:
+                    state.seconds_until_inactive = -1
+                    self._dirty.set()
+                await trigger.wait()
                 continue
 
-            hub_color = self._nt.get_practice_led_color() or Color(*self.hub.led_idle_color)
-            now = time.monotonic()
-            control = self._nt.get_fms_control_data()
+            hub_color = nt.get_practice_led_color() or idle_color
+            now = monotonic()
+            control = nt.get_fms_control_data()
 
             # Period with 3 s auto grace period
-            if control == self._nt.FMS_CONTROL_DATA_AUTO:
-                auto_grace_until = now + 3.0
-                fms_period = "auto"
-            elif now < auto_grace_until:
-                fms_period = "auto"
-            elif control == self._nt.FMS_CONTROL_DATA_TELEOP:
-                fms_period = "teleop"
+            if control == fms_auto:
+                self._auto_grace_until = now + 3.0
+                fms_period = PERIOD_AUTO
+            elif now < self._auto_grace_until:
+                fms_period = PERIOD_AUTO
+            elif control == fms_teleop:
+                fms_period = PERIOD_TELEOP
             else:
-                fms_period = "disabled"
+                fms_period = PERIOD_DISABLED
 
             # Hub active with 3 s grace period
-            if self._nt.get_practice_hub_active():
-                hub_grace_until = now + 3.0
+            if nt.get_practice_hub_active():
+                self._hub_grace_until = now + 3.0
                 hub_active = True
             else:
-                hub_active = now < hub_grace_until
+                hub_active = now < self._hub_grace_until
+
+            seconds_left = nt.get_seconds_until_inactive()
+
+            if fms_period != state.fms_period or hub_active != state.hub_is_active:
+                state.fms_period = fms_period
+                state.hub_is_active = hub_active
+                self._dirty.set()
 
-            if fms_period == "auto" or (fms_period == "teleop" and hub_active):
-                seconds_left = self._nt.get_seconds_until_inactive()
-                should_blink = fms_period == "teleop" and 0 <= seconds_left <= 3
+            # Seconds until inactive — kept as the whole-second countdown the
+            # dashboard shows, so only a change of displayed value broadcasts
+            whole_seconds = math.ceil(seconds_left)
+            if whole_seconds != state.seconds_until_inactive:
+                state.seconds_until_inactive = whole_seconds
+                self._dirty.set()
+
+            should_blink = False
+            if fms_period == PERIOD_AUTO or (fms_period == PERIOD_TELEOP and hub_active):
+                should_blink = fms_period == PERIOD_TELEOP and 0 <= seconds_left <= 3
                 if should_blink:
-                    blink_on = not blink_on
-                    active_color = hub_color if blink_on else Color(0, 0, 0)
-                    self._leds.set_all(active_color)
-                    new_led_color = (active_color.r, active_color.g, active_color.b)
+                    # Toggle on the 250 ms cadence only — NT updates also wake us
+                    if now >= next_toggle:
+                        blink_on = not blink_on
+                        next_toggle += BLINK_INTERVAL_S
+                        if next_toggle <= now:  # blink just started (or we overslept)
+                            next_toggle = now + BLINK_INTERVAL_S
+                    active_color = hub_color if blink_on else off
                 else:
                     blink_on = False
-                    self._leds.set_all(hub_color)
-                    new_led_color = (hub_color.r, hub_color.g, hub_color.b)
-                self._leds.show()
+                    next_toggle = 0.0
+                    active_color = hub_color
+                new_led_color = tuple(active_color)
             else:
                 blink_on = False
-                self._leds.clear()
+                next_toggle = 0.0
+                active_color = None
                 new_led_color = (0, 0, 0)
 
-            if new_led_color != self.state.led_color:
-                self.state.led_color = new_led_color
-                await self._broadcast_state()
+            # Only write to the strip when the colour actually changes
+            if new_led_color != state.led_color:
+                if active_color is None:
+                    leds.clear()
+                else:
+                    leds.set_all(active_color)
+                    leds.show()
+                state.led_color = new_led_color
+                self._dirty.set()
 
-            await asyncio.sleep(0.25)
+            # Sleep until an NT value changes, the next blink toggle, or a grace expiry
+            wake_in = next_toggle - now if should_blink else None
+            for deadline in (self._auto_grace_until, self._hub_grace_until):
+                if deadline > now and (wake_in is None or deadline - now < wake_in):
+                    wake_in = deadline - now
+            await _wait_for_event(trigger, wake_in)
 
-    # ── Status polling ───────────────────────────────────────────────────
+    # ── Status tracking ──────────────────────────────────────────────────
 
-    async def _status_poll(self) -> None:
-        while not self._shutdown_event.is_set():
-            await asyncio.sleep(1.0)
-
-            if self.state.mode in ("robot_teleop", "robot_practice"):
-                connected = self._nt.is_connected
-                if connected != self.state.nt_connected:
-                    self.state.nt_connected = connected
-                    await self._broadcast_state()
-
-                hub_active = self._nt.get_hub_active()
-
-                if self.state.mode == "robot_practice":
-                    now = time.monotonic()
-                    control = self._nt.get_fms_control_data()
-
-                    # Period detection with 3s auto grace period
-                    if control == self._nt.FMS_CONTROL_DATA_AUTO:
-                        self._auto_grace_until = now + 3.0
-                        fms_period = "auto"
-                    elif now < self._auto_grace_until:
-                        fms_period = "auto"
-                    elif control == self._nt.FMS_CONTROL_DATA_TELEOP:
-                        fms_period = "teleop"
-                    else:
-                        fms_period = "disabled"
-
-                    # Hub active with 3s grace period
-                    if self._nt.get_practice_hub_active():
-                        self._hub_grace_until = now + 3.0
-                        hub_active = True
-                    else:
-                        hub_active = now < self._hub_grace_until
+    async def _teleop_status_task(self) -> None:
+        """Mirror FMS/mode and HubTracker/isActive into the state in robot_teleop mode.
 
-                else:
-                    fms_period = self._nt.get_fms_mode()
-
-                changed = (
-                    fms_period != self.state.fms_period or hub_active != self.state.hub_is_active
-                )
-                self.state.fms_period = fms_period
-                self.state.hub_is_active = hub_active
-
-                if changed:
-                    await self._broadcast_state()
-
-            # Modbus PLC activity — green only when a holding register was read
-            # within the past second (i.e. the FMS PLC is actively polling)
-            modbus_active = self._modbus.is_plc_active
-            if modbus_active != self.state.modbus_active:
-                self.state.modbus_active = modbus_active
-                await self._broadcast_state()
-
-            # sACN activity (only meaningful in fms mode, but always poll)
-            sacn_active = self._sacn.is_active
-            if sacn_active != self.state.sacn_active:
-                self.state.sacn_active = sacn_active
-                await self._broadcast_state()
-
-            # Seconds until inactive — broadcast each time the integer value changes
-            new_seconds = (
-                self._nt.get_seconds_until_inactive()
-                if self.state.mode == "robot_practice"
-                else -1.0
-            )
-            if int(new_seconds) != int(self.state.seconds_until_inactive):
-                self.state.seconds_until_inactive = new_seconds
-                await self._broadcast_state()
+        Sleeps on ``_teleop_trigger``, which the NT client sets when either topic
+        changes value and ``_apply_mode`` sets on every mode change.
+        """
+        nt = self._nt
+        state = self.state
+        trigger = self._teleop_trigger
+
+        while not self._shutdown_event.is_set():
+            trigger.clear()
+            if state.mode == MODE_TELEOP:
+                fms_period = sys.intern(nt.get_fms_mode())
+                hub_active = nt.get_hub_active()
+                if fms_period != state.fms_period or hub_active != state.hub_is_active:
+                    state.fms_period = fms_period
+                    state.hub_is_active = hub_active
+                    self._dirty.set()
+            await trigger.wait()
+
+    def _on_nt_connection(self, connected: bool) -> None:
+        # Ignore events still in flight after the client was stopped
+        if self.state.mode not in ROBOT_MODES:
+            return
+        if connected != self.state.nt_connected:
+            self.state.nt_connected = connected
+            self._dirty.set()
+        if not connected:
+            # NTClient has reset its cached values; re-read them so the motors stop
+            self._motor_trigger.set()
+            self._practice_trigger.set()
+            self._teleop_trigger.set()
+
+    def _on_plc_active(self, active: bool) -> None:
+        # Green only while the FMS PLC is actively polling the holding registers
+        if active != self.state.modbus_active:
+            self.state.modbus_active = active
+            self._dirty.set()
+
+    def _on_sacn_active(self, active: bool) -> None:
+        if active != self.state.sacn_active:
+            self.state.sacn_active = active
+            self._dirty.set()
 
     # ── Motor polling ────────────────────────────────────────────────────
 
     async def _motor_poll(self) -> None:
-        """Drive motors at 20 Hz from Modbus coils (fms) or NT (robot modes).
+        """Drive motors from Modbus coils (fms), NT (robot modes) or the admin page.
+
+        Sleeps on ``_motor_trigger``, which is set on PLC coil writes, NT
+        throttle changes, manual start/stop/speed changes and mode changes; it
+        also wakes every MOTOR_HEARTBEAT_S as a safety net.
 
         Coil map (MOTOR_COIL_BASE + offset) — both motors share one coil pair:
           offset 0: enable  (True = run both motors)
           offset 1: forward (True = forward, False = reverse)
         NT topics: BearHub/motor{N}Throttle (double, -1.0 to 1.0)
         """
-        from src.config import MOTOR_COIL_BASE, MOTOR_PINS
-
+        motors = self._motors
+        modbus = self._modbus
+        nt = self._nt
+        state = self.state
+        enable_coil = MOTOR_COIL_BASE
+        forward_coil = MOTOR_COIL_BASE + 1
         num_motors = len(MOTOR_PINS)
-        while not self._shutdown_event.is_set():
-            await asyncio.sleep(0.05)  # 20 Hz
+        motor_indices = range(num_motors)
+        idle = (0.0,) * num_motors
+        last_throttles: tuple[float, ...] | None = None  # last values sent to the motors
 
-            throttles = [0.0] * num_motors
+        # Per-mode throttle sources — chosen when the mode changes, not on every tick
+        def fms_throttles() -> tuple[float, ...]:
+            enable = modbus.get_coil(enable_coil)
+            forward = modbus.get_coil(forward_coil)
+            shared_throttle = (1.0 if forward else -1.0) if enable else 0.0
+            return (shared_throttle,) * num_motors
 
-            if self.state.mode == "fms":
-                enable = self._modbus.get_coil(MOTOR_COIL_BASE)
-                forward = self._modbus.get_coil(MOTOR_COIL_BASE + 1)
-                shared_throttle = (1.0 if forward else -1.0) if enable else 0.0
-                throttles = [shared_throttle] * num_motors
+        def nt_throttles() -> tuple[float, ...]:
+            return tuple(nt.get_motor_throttle(i) for i in motor_indices)
 
-            elif self.state.mode in ("robot_teleop", "robot_practice"):
-                for i in range(num_motors):
-                    throttles[i] = self._nt.get_motor_throttle(i)
+        def manual_throttles() -> tuple[float, ...]:
+            return (state.motor_speed,) * num_motors if state.motors_running else idle
 
-            elif self.state.motors_running:
-                throttles = [self.state.motor_speed] * num_motors
+        handlers = {MODE_FMS: fms_throttles, MODE_TELEOP: nt_throttles, MODE_PRACTICE: nt_throttles}
+        mode = None
+        throttles_for = manual_throttles
+        trigger = self._motor_trigger
+
+        while not self._shutdown_event.is_set():
+            trigger.clear()
+            if state.mode is not mode:
+                mode = state.mode
+                throttles_for = handlers.get(mode, manual_throttles)
+            throttles = throttles_for()
 
-            for i, throttle in enumerate(throttles):
-                self._motors.set_throttle(i, throttle)
+            # Only touch the motors when a throttle actually changed
+            if throttles != last_throttles:
+                for i, throttle in enumerate(throttles):
+                    if last_throttles is None or throttle != last_throttles[i]:
+                        motors.set_throttle(i, throttle)
+                last_throttles = throttles
+
+            await _wait_for_event(trigger, MOTOR_HEARTBEAT_S)
 
     # ── Counts reset ─────────────────────────────────────────────────────
 
@@ -453,19 +638,19 @@ class App:
         self.state.auto_count = 0
         self.state.inactive_count = 0
         self.state.led_color = (0, 0, 0)
-        if self.state.mode == "fms":
+        if self.state.mode == MODE_FMS:
             self._modbus.set_ball_count(self.hub.modbus_ball_count_register, 0)
-        elif self.state.mode in ("robot_teleop", "robot_practice"):
+        elif self.state.mode in ROBOT_MODES:
             self._nt.publish_count(0)
         self._leds.clear()
-        await self._broadcast_state()
+        self._dirty.set()
 
     # ── NT server address ────────────────────────────────────────────────
 
     async def set_nt_server_address(self, address: str) -> None:
         self.state.nt_server_address = address
         log.info("NT server address set to %s", address)
-        if self.state.mode in ("robot_teleop", "robot_practice"):
+        if self.state.mode in ROBOT_MODES:
             self._nt.stop()
             self.state.nt_connected = False
             try:
@@ -473,7 +658,7 @@ class App:
             except Exception:
                 log.warning("NT unavailable — robot connection disabled")
         self._save_state()
-        await self._broadcast_state()
+        self._dirty.set()
 
     # ── Ball simulator ───────────────────────────────────────────────────
 
@@ -481,7 +666,7 @@ class App:
         """Toggle the simulator button on/off. Returns the new state."""
         self.state.simulator_enabled = not self.state.simulator_enabled
         log.info("Ball simulator %s", "enabled" if self.state.simulator_enabled else "disabled")
-        await self._broadcast_state()
+        self._dirty.set()
         return self.state.simulator_enabled
 
     # ── Motors ───────────────────────────────────────────────────────────
@@ -490,7 +675,8 @@ class App:
         """Toggle motors on/off manually. Returns the new state."""
         self.state.motors_running = not self.state.motors_running
         log.info("Motors %s", "started" if self.state.motors_running else "stopped")
-        await self._broadcast_state()
+        self._motor_trigger.set()
+        self._dirty.set()
         return self.state.motors_running
 
     async def set_motor_speed(self, speed: float) -> None:
@@ -498,14 +684,42 @@ class App:
         self.state.motor_speed = max(0.0, min(1.0, speed))
         log.info("Motor speed set to %.2f", self.state.motor_speed)
         self._save_state()
-        await self._broadcast_state()
+        self._motor_trigger.set()
+        self._dirty.set()
 
     # ── State broadcast ──────────────────────────────────────────────────
 
-    async def _broadcast_state(self) -> None:
-        from src.web.server import _build_state_message, broadcast
+    async def _broadcaster(self) -> None:
+        """Send at most one state broadcast per BROADCAST_COALESCE_S.
+
+        State changes only set ``self._dirty``; bursts of ball events or sACN
+        colour updates that land within the coalescing window collapse into a
+        single JSON build and WebSocket fan-out.
+        """
+        while not self._shutdown_event.is_set():
+            await self._dirty.wait()
+            await asyncio.sleep(BROADCAST_COALESCE_S)
+            self._dirty.clear()
+            await self._broadcast_state()
 
-        await broadcast(_build_state_message(self))
+    def current_state_frame(self) -> bytes:
+        """The encoded state message for a newly connected client.
+
+        Reuses the last broadcast frame when there is one; any change since is
+        sent by the coalesced broadcaster.
+        """
+        frame = self._last_state_json
+        if frame is None:
+            frame = web_server.encode_message(web_server._build_state_message(self))
+        return frame
+
+    async def _broadcast_state(self) -> None:
+        """Encode the state message and send it, skipping it if nothing changed."""
+        frame = web_server.encode_message(web_server._build_state_message(self))
+        if frame == self._last_state_json:
+            return
+        self._last_state_json = frame
+        await web_server.broadcast_bytes(frame)
 
     # ── Persistence ──────────────────────────────────────────────────────
 
@@ -515,20 +729,38 @@ class App:
             return
         try:
             data = json.loads(path.read_text())
-            self.state.mode = data.get("mode", "demo")
+            self.state.mode = sys.intern(data.get("mode", MODE_DEMO))
             self.state.nt_server_address = data.get("nt_server_address", NT_SERVER_ADDRESS)
             self.state.motor_speed = float(data.get("motor_speed", MOTOR_SPEED))
         except Exception:
             log.warning("Could not load state from %s", STATE_FILE)
 
     def _save_state(self) -> None:
+        """Schedule a write of the persisted settings (coalesced by _state_writer)."""
+        self._save_dirty.set()
+
+    async def _state_writer(self) -> None:
+        """Write the state file off the event loop, at most once per STATE_SAVE_COALESCE_S."""
+        while not self._shutdown_event.is_set():
+            await self._save_dirty.wait()
+            await asyncio.sleep(STATE_SAVE_COALESCE_S)
+            self._save_dirty.clear()
+            await asyncio.to_thread(self._write_state, self._persisted_state())
+
+    def _persisted_state(self) -> dict:
+        return {
+            "mode": self.state.mode,
+            "nt_server_address": self.state.nt_server_address,
+            "motor_speed": self.state.motor_speed,
+        }
+
+    def _write_state(self, data: dict) -> None:
+        """Atomically replace the state file so a crash never leaves it half-written."""
         path = Path(STATE_FILE)
+        tmp = path.with_suffix(".tmp")
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps({
-                "mode": self.state.mode,
-                "nt_server_address": self.state.nt_server_address,
-                "motor_speed": self.state.motor_speed,
-            }))
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, path)
         except Exception:
             log.warning("Could not save state to %s", STATE_FILE)
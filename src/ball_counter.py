@@ -2,13 +2,15 @@
 
 Each sensor channel posts its index to the asyncio queue on a falling edge
 (beam broken = ball scored). lgpio callbacks run in a separate thread; we
-bridge into the event loop via loop.call_soon_threadsafe().
+bridge into the event loop via loop.call_soon_threadsafe(), scheduling at most
+one drain per burst of edges rather than one wakeup per edge.
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
 from typing import Protocol
 
 from src.config import BALL_REARM_MS, BALL_SENSOR_PINS
@@ -24,13 +26,19 @@ class BallCounter:
 
     def __init__(self, pins: list[int] = BALL_SENSOR_PINS, rearm_ms: int = BALL_REARM_MS) -> None:
         self._pins = pins
+        self._pin_to_channel: dict[int, int] = {pin: i for i, pin in enumerate(pins)}
         self._rearm_ms = rearm_ms
+        self._rearm_ns = rearm_ms * 1_000_000
         self._handle: int | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._queue: asyncio.Queue[int] | None = None
         self._callbacks: list = []  # must hold references or lgpio GCs them
-        self._beam_broken: dict[int, bool] = {}  # True while beam is currently interrupted
-        self._last_count_time: dict[int, float] = {}  # monotonic time of last count per pin
+        # Per-channel edge state, indexed via _pin_to_channel
+        self._beam_broken: list[bool] = [False] * len(pins)  # True while beam is interrupted
+        self._last_count_ns: list[int] = [0] * len(pins)  # monotonic_ns of last count
+        # Channels counted on the lgpio thread, waiting to be moved into the queue
+        self._pending: deque[int] = deque()
+        self._drain_scheduled = False
 
     def start(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue[int]) -> None:
         import lgpio  # type: ignore[import]
@@ -46,27 +54,40 @@ class BallCounter:
             self._callbacks.append(cb)
 
     def _on_edge(self, chip: int, gpio: int, level: int, tick: int) -> None:
+        # Callbacks are only registered for self._pins, so every gpio has a channel
+        channel = self._pin_to_channel[gpio]
         if level != 0:  # rising edge — beam restored, re-arm
-            self._beam_broken[gpio] = False
+            self._beam_broken[channel] = False
             return
         # falling edge — beam broken
-        if self._beam_broken.get(gpio, False):
+        if self._beam_broken[channel]:
             return  # sustained low, ignore
-        now = time.monotonic()
-        if (now - self._last_count_time.get(gpio, 0.0)) * 1000 < self._rearm_ms:
+        now = time.monotonic_ns()
+        if now - self._last_count_ns[channel] < self._rearm_ns:
             return  # sensor pulsed again too soon (entry + exit pulse), ignore
-        self._beam_broken[gpio] = True
-        self._last_count_time[gpio] = now
-        channel = self._pins.index(gpio) if gpio in self._pins else gpio
+        self._beam_broken[channel] = True
+        self._last_count_ns[channel] = now
         if self._loop and self._queue:
-            self._loop.call_soon_threadsafe(self._queue.put_nowait, channel)
+            # deque.append is atomic; only wake the loop if no drain is already pending
+            self._pending.append(channel)
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self._loop.call_soon_threadsafe(self._drain_pending)
+
+    def _drain_pending(self) -> None:
+        """Move counted channels into the asyncio queue (runs on the event loop)."""
+        # Clear the flag before draining so an append racing with us schedules a new drain
+        self._drain_scheduled = False
+        pending = self._pending
+        while pending:
+            self._queue.put_nowait(pending.popleft())
 
     def stop(self) -> None:
         for cb in self._callbacks:
             cb.cancel()
         self._callbacks.clear()
-        self._beam_broken.clear()
-        self._last_count_time.clear()
+        self._beam_broken = [False] * len(self._pins)
+        self._last_count_ns = [0] * len(self._pins)
         if self._handle is not None:
             import lgpio  # type: ignore[import]
 
@@ -47,7 +47,7 @@ THRESHOLD_SUPERCHARGED: int = 360
 STATE_FILE: str = "/var/lib/bear-hub/state.json"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HubConfig:
     name: str
     modbus_ball_count_register: int  # 0-based pymodbus address
@@ -4,21 +4,35 @@ Each WS2812b bit is encoded as 8 SPI bits:
   1 → 0b1111_1100 (T1H ≈ 924 ns)
   0 → 0b1100_0000 (T0H ≈ 308 ns)
 
-Each 24-bit GRB pixel becomes 24 bytes of SPI data.
-Buffer layout: 42 zero-byte preamble + led_count × 24 bytes.
+Each 24-bit GRB pixel becomes 24 bytes of SPI data. Pixels are stored in GRB
+order when set, so encoding needs no per-frame channel reorder.
+Buffer layout: 48 zero-byte preamble + led_count × 24 bytes. The preamble is a
+multiple of 8 so the pixel section can be written as aligned uint64 words.
+
+SPI transfers run on a writer thread from two alternating buffers, so the next
+frame is encoded while the previous one is still on the bus.
 """
 
 from __future__ import annotations
 
+import logging
+import queue
+import threading
 from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
 from typing import Protocol
 
 import numpy as np
 
 from src.config import LED_COUNT, SPI_BUS, SPI_DEVICE, SPI_SPEED_HZ
 
+log = logging.getLogger(__name__)
+
 Color = namedtuple("Color", ["r", "g", "b"])
 
+SPIDEV_BUFSIZ_PATH = Path("/sys/module/spidev/parameters/bufsiz")
+
 
 class LedStripProtocol(Protocol):
     def set_pixel_color(self, i: int, color: Color) -> None: ...
@@ -26,6 +40,7 @@ class LedStripProtocol(Protocol):
     def show(self) -> None: ...
     def clear(self) -> None: ...
     def set_brightness(self, brightness: float) -> None: ...
+    def close(self) -> None: ...
 
 
 class LedStrip:
@@ -33,14 +48,29 @@ class LedStrip:
 
     LED_ZERO: int = 0b1100_0000
     LED_ONE: int = 0b1111_1100
-    PREAMBLE: int = 42
+    PREAMBLE: int = 48
+
+    # SPI encoding of every possible colour byte: entry b holds the 8 SPI bytes
+    # for byte b (MSB first in memory) packed into one uint64. Built once for
+    # the class; instances fold brightness into their own copy.
+    _BIT_LUT64: np.ndarray = (
+        np.where(
+            np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1) == 1,
+            LED_ONE,
+            LED_ZERO,
+        )
+        .astype(np.uint8)
+        .view(np.uint64)
+        .ravel()
+    )
 
     def __init__(self, led_count: int = LED_COUNT) -> None:
         from spidev import SpiDev  # type: ignore[import]
 
         self._led_count = led_count
         self._brightness: float = 1.0
-        self._pixels: list[Color] = [Color(0, 0, 0)] * led_count
+        # Pixels stored as an (N, 3) array already in the strip's GRB order
+        self._pixels_grb = np.zeros((led_count, 3), dtype=np.uint8)
 
         self._device = SpiDev()
         self._device.open(SPI_BUS, SPI_DEVICE)
@@ -48,67 +78,170 @@ class LedStrip:
         self._device.mode = 0b00
         self._device.lsbfirst = False
 
-        # Pre-build the "all off" clear buffer
-        self._clear_buffer = np.zeros(self.PREAMBLE + led_count * 24, dtype=np.uint8)
-        self._clear_buffer[self.PREAMBLE :] = np.full(led_count * 24, self.LED_ZERO, dtype=np.uint8)
-
-        # Working buffer (preamble stays zero)
-        self._buffer = np.zeros(self.PREAMBLE + led_count * 24, dtype=np.uint8)
+        # spidev splits a write larger than its bufsiz into several transfers,
+        # and the gap between them can latch the strip mid-frame
+        frame_len = self.PREAMBLE + led_count * 24
+        bufsiz = _spidev_bufsiz()
+        if bufsiz is not None and bufsiz < frame_len:
+            log.warning(
+                "spidev bufsiz is %d bytes but a %d-LED frame is %d — add "
+                "spidev.bufsiz=%d to /boot/firmware/cmdline.txt",
+                bufsiz,
+                led_count,
+                frame_len,
+                1 << (frame_len - 1).bit_length(),
+            )
+
+        self._clear_buffer = self._clear_frame(led_count)
+
+        # _BIT_LUT64 with brightness folded in; rebuilt only by set_brightness()
+        self._encode_lut = self._BIT_LUT64.copy()
+
+        # Two working buffers (preamble stays zero), each with a uint64 view of its
+        # pixel section, the pixels last encoded into it (so show() re-encodes only
+        # changes) and an event that is set while the writer is not sending it
+        self._buffers: list[np.ndarray] = []
+        self._buffers64: list[np.ndarray] = []
+        self._encoded_grb: list[np.ndarray] = []
+        self._encode_all = [True, True]
+        self._free = [threading.Event(), threading.Event()]
+        for free in self._free:
+            buffer = np.zeros(self.PREAMBLE + led_count * 24, dtype=np.uint8)
+            self._buffers.append(buffer)
+            self._buffers64.append(buffer[self.PREAMBLE :].view(np.uint64))
+            self._encoded_grb.append(np.zeros((led_count, 3), dtype=np.uint8))
+            free.set()
+        self._back = 0  # buffer the next show() encodes into
+        # Scratch arrays for show()'s change detection, so a frame allocates no masks
+        self._diff = np.zeros((led_count, 3), dtype=bool)
+        self._changed_mask = np.zeros(led_count, dtype=bool)
+
+        self._tx_queue: queue.Queue[tuple[np.ndarray, threading.Event | None] | None] = (
+            queue.Queue()
+        )
+        self._writer = threading.Thread(target=self._write_loop, name="led-spi", daemon=True)
+        self._writer.start()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _clear_frame(cls, led_count: int) -> np.ndarray:
+        """The read-only "all off" frame for a strip length, shared by every instance."""
+        frame = np.full(cls.PREAMBLE + led_count * 24, cls.LED_ZERO, dtype=np.uint8)
+        frame[: cls.PREAMBLE] = 0
+        frame.flags.writeable = False
+        return frame
 
     def set_pixel_color(self, i: int, color: Color) -> None:
-        self._pixels[i] = color
+        r, g, b = color
+        self._pixels_grb[i] = (g, r, b)
 
     def set_all(self, color: Color) -> None:
-        self._pixels = [color] * self._led_count
+        r, g, b = color
+        self._pixels_grb[:] = (g, r, b)
 
     def show(self) -> None:
-        """Encode pixel list to SPI bytes and write to strip."""
-        grb = np.array(
-            [
-                [
-                    int(p.g * self._brightness),
-                    int(p.r * self._brightness),
-                    int(p.b * self._brightness),
-                ]
-                for p in self._pixels
-            ],
-            dtype=np.uint8,
-        )
-        self._write(grb)
-
-    def _write(self, grb: np.ndarray) -> None:
-        """Convert (N, 3) GRB array to SPI buffer and send."""
-        color_bits = np.unpackbits(grb.ravel())
-        self._buffer[self.PREAMBLE :] = np.where(color_bits == 1, self.LED_ONE, self.LED_ZERO)
-        self._device.writebytes2(self._buffer)
+        """Encode pixel array to SPI bytes and write to strip.
+
+        Only pixels that changed since the last show() are re-encoded; the
+        whole buffer is still sent since the strip needs a full frame.
+
+        Blocks only if both buffers are still queued for the writer thread.
+        """
+        back = self._back
+        self._back ^= 1
+        free = self._free[back]
+        free.wait()
+        free.clear()
+
+        pixels = self._pixels_grb
+        encoded = self._encoded_grb[back]
+        buffer64 = self._buffers64[back]
+        if self._encode_all[back]:
+            self._encode_all[back] = False
+            changed = None
+        else:
+            np.not_equal(pixels, encoded, out=self._diff)
+            changed = np.flatnonzero(np.any(self._diff, axis=1, out=self._changed_mask))
+            if changed.size == self._led_count:
+                changed = None
+
+        if changed is None:
+            # A single gather straight into the preallocated buffer. uint8 indices
+            # can never leave the 256-entry table, so mode="clip" is safe; the
+            # default mode="raise" would buffer ``out`` through a copy.
+            np.take(self._encode_lut, pixels.ravel(), out=buffer64, mode="clip")
+            encoded[:] = pixels
+        elif changed.size:
+            buffer64.reshape(self._led_count, 3)[changed] = self._encode_lut[pixels[changed]]
+            encoded[changed] = pixels[changed]
+        self._tx_queue.put((self._buffers[back], free))
 
     def clear(self) -> None:
-        """Reset all LEDs to off immediately."""
-        self._pixels = [Color(0, 0, 0)] * self._led_count
-        self._device.writebytes2(self._clear_buffer)
+        """Reset all LEDs to off, after any frames already queued."""
+        self._pixels_grb[:] = 0
+        self._tx_queue.put((self._clear_buffer, None))
+
+    def flush(self) -> None:
+        """Block until every queued frame has been sent."""
+        self._tx_queue.join()
+
+    def close(self) -> None:
+        """Send any queued frames, then stop the writer thread."""
+        self._tx_queue.put(None)
+        self._writer.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._tx_queue.get()
+            if item is None:
+                self._tx_queue.task_done()
+                return
+            buffer, free = item
+            try:
+                self._device.writebytes2(buffer)
+            except Exception:
+                log.exception("LED SPI write failed")
+            finally:
+                if free is not None:
+                    free.set()
+                self._tx_queue.task_done()
 
     def set_brightness(self, brightness: float) -> None:
         self._brightness = max(0.0, min(1.0, brightness))
+        # Brightness scales the 256 table entries rather than the pixels, so show()
+        # needs no per-frame multiply; the table is rewritten in place
+        scaled = (np.arange(256) * self._brightness).astype(np.uint8)
+        np.take(self._BIT_LUT64, scaled, out=self._encode_lut)
+        self._encode_all[:] = (True, True)
 
     @property
     def led_count(self) -> int:
         return self._led_count
 
 
-class NullLedStrip:
-    """No-op LED strip used when running without hardware."""
+def _spidev_bufsiz() -> int | None:
+    """Return the spidev driver's per-transfer buffer size, or None if unknown."""
+    try:
+        return int(SPIDEV_BUFSIZ_PATH.read_text())
+    except (OSError, ValueError):
+        return None
 
-    def set_pixel_color(self, i: int, color: Color) -> None:
-        pass
 
-    def set_all(self, color: Color) -> None:
-        pass
+def _noop(*args: object) -> None:
+    pass
 
-    def show(self) -> None:
-        pass
 
-    def clear(self) -> None:
-        pass
+class NullLedStrip:
+    """No-op LED strip used when running without hardware.
 
-    def set_brightness(self, brightness: float) -> None:
-        pass
+    Methods are shared staticmethods, so calls skip bound-method creation.
+    """
+
+    __slots__ = ()
+
+    set_pixel_color = staticmethod(_noop)
+    set_all = staticmethod(_noop)
+    show = staticmethod(_noop)
+    clear = staticmethod(_noop)
+    set_brightness = staticmethod(_noop)
+    close = staticmethod(_noop)
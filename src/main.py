@@ -79,7 +79,7 @@ def main() -> None:
         sacn_receiver=sacn_receiver,
     )
 
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
     asyncio.set_event_loop(loop)
 
     def _signal_handler() -> None:
@@ -94,5 +94,15 @@ def main() -> None:
         loop.close()
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """uvloop's event loop when installed (uvicorn[standard] pulls it in on Linux)."""
+    try:
+        import uvloop  # type: ignore[import]
+    except ImportError:
+        log.info("uvloop not installed — using the default asyncio event loop")
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 if __name__ == "__main__":
     main()
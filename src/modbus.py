@@ -13,15 +13,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+from collections.abc import Callable
 
 from pymodbus.datastore import (  # type: ignore[import]
     ModbusDeviceContext,
     ModbusSequentialDataBlock,
     ModbusServerContext,
 )
-from pymodbus.server import StartAsyncTcpServer  # type: ignore[import]
 
+from src.activity import ActivityMonitor
 from src.config import MODBUS_HOST, MODBUS_PORT, MODBUS_UNIT_ID
 
 log = logging.getLogger(__name__)
@@ -30,23 +30,48 @@ MODBUS_ACTIVE_TIMEOUT = 1.0  # seconds
 
 
 class _TrackedHoldingRegisters(ModbusSequentialDataBlock):
-    """Holding register block that records the last time getValues was called."""
+    """Holding register block that counts getValues calls (PLC reads)."""
 
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         super().__init__(*args, **kwargs)
-        self.last_read_time: float = 0.0
+        self.read_count: int = 0
+        self.on_read: Callable[[], None] | None = None  # called after each read
 
     def getValues(self, address: int, count: int = 1):  # type: ignore[override]
-        self.last_read_time = time.monotonic()
+        self.read_count += 1
+        if self.on_read is not None:
+            self.on_read()
+        if count == 1:
+            # Single-register reads (the PLC polling one hub's count) skip the
+            # base class's bounds arithmetic and slice
+            start = address - self.address
+            values = self.values
+            if 0 <= start < len(values):
+                return [values[start]]
         return super().getValues(address, count)
 
 
+class _TrackedCoils(ModbusSequentialDataBlock):
+    """Coil block that reports each setValues call (PLC writes)."""
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.on_write: Callable[[], None] | None = None  # called after each write
+
+    def setValues(self, address: int, values):  # type: ignore[override]
+        result = super().setValues(address, values)
+        if self.on_write is not None:
+            self.on_write()
+        return result
+
+
 class ModbusServer:
     def __init__(self) -> None:
         self._hr = _TrackedHoldingRegisters(0, [0] * 10)
-        hr = self._hr
-        co = ModbusSequentialDataBlock(0, [False] * 10)
-        store = ModbusDeviceContext(hr=hr, co=co)
+        self._plc_activity = ActivityMonitor(MODBUS_ACTIVE_TIMEOUT)
+        self._hr.on_read = self._plc_activity.notify
+        self._co = _TrackedCoils(0, [False] * 10)
+        store = ModbusDeviceContext(hr=self._hr, co=self._co)
         self._context = ModbusServerContext(devices=store, single=True)
         self._server_task: asyncio.Task | None = None
         self._server = None
@@ -56,6 +81,9 @@ class ModbusServer:
         self._server_task = asyncio.create_task(self._run())
 
     async def _run(self) -> None:
+        # Deferred: the server stack is only needed once fms mode starts it
+        from pymodbus.server import StartAsyncTcpServer  # type: ignore[import]
+
         try:
             await StartAsyncTcpServer(
                 context=self._context,
@@ -79,14 +107,29 @@ class ModbusServer:
                 pass
         log.info("Modbus server stopped")
 
+    def watch_plc_active(
+        self, loop: asyncio.AbstractEventLoop, on_change: Callable[[bool], None]
+    ) -> None:
+        """Call ``on_change(active)`` on ``loop`` whenever is_plc_active flips."""
+        self._plc_activity.watch(loop, on_change)
+
+    def watch_coils(self, loop: asyncio.AbstractEventLoop, on_write: Callable[[], None]) -> None:
+        """Call ``on_write()`` on ``loop`` after each PLC write to the coils."""
+        self._co.on_write = lambda: loop.call_soon_threadsafe(on_write)
+
     @property
     def is_plc_active(self) -> bool:
-        """True if a holding register was read within the past second."""
-        return (time.monotonic() - self._hr.last_read_time) < MODBUS_ACTIVE_TIMEOUT
+        """True while the PLC is reading holding registers (as last reported to the watcher)."""
+        return self._plc_activity.active
 
     def set_ball_count(self, register: int, count: int) -> None:
-        """Write ball count to a holding register (0-based pymodbus address)."""
-        self._context[MODBUS_UNIT_ID].setValues(3, register, [count])
+        """Write ball count to a holding register (0-based pymodbus address).
+
+        Stores straight into the block's value list rather than going through
+        the server/device context, which builds a list and logs on every call.
+        The device context maps protocol address N to block address N + 1.
+        """
+        self._hr.values[register + 1 - self._hr.address] = count
 
     def get_coil(self, address: int) -> bool:
         """Read a single coil written by the FMS PLC."""
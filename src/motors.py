@@ -18,6 +18,12 @@ from src.config import MOTOR_PINS
 PWM_FREQUENCY: int = 50  # Hz (standard servo/ESC frequency)
 _DUTY_NEUTRAL: float = 7.5  # 1500 µs at 50 Hz — Spark Max neutral
 _DUTY_RANGE: float = 2.5    # ±2.5% → spans 1000–2000 µs
+_THROTTLE_STEPS: int = 1000  # throttle resolution per direction (0.1%)
+# Duty cycle for each throttle step, indexed by step + _THROTTLE_STEPS
+_DUTY_LUT: tuple[float, ...] = tuple(
+    _DUTY_NEUTRAL + (step / _THROTTLE_STEPS) * _DUTY_RANGE
+    for step in range(-_THROTTLE_STEPS, _THROTTLE_STEPS + 1)
+)
 
 
 class MotorsProtocol(Protocol):
@@ -39,38 +45,45 @@ class Motors:
         self._lgpio = lgpio
         self._handle = lgpio.gpiochip_open(0)
         self._pins = pins
-        self._active_pins: set[int] = set()
-        self._current_duty: dict[int, float] = {}  # last duty sent per pin
+        # Last throttle step sent per motor index; None while the pin is unclaimed
+        self._steps: list[int | None] = [None] * len(pins)
 
     def set_throttle(self, index: int, throttle: float) -> None:
-        pin = self._pins[index]
-        throttle = max(-1.0, min(1.0, throttle))
-        # Map [-1, 1] → [5.0%, 10.0%] duty cycle (1 ms – 2 ms pulse at 50 Hz)
-        duty = _DUTY_NEUTRAL + throttle * _DUTY_RANGE
-        if pin not in self._active_pins:
-            self._lgpio.gpio_claim_output(self._handle, pin)
-            self._active_pins.add(pin)
-            self._lgpio.tx_pwm(self._handle, pin, PWM_FREQUENCY, duty)
-            self._current_duty[pin] = duty
-        elif self._current_duty.get(pin) != duty:
+        step = round(max(-1.0, min(1.0, throttle)) * _THROTTLE_STEPS)
+        current = self._steps[index]
+        if current == step:
             # Only restart PWM when duty actually changes — restarting on every
             # poll cycle interrupts the waveform mid-period and causes ESC jitter.
-            self._lgpio.tx_pwm(self._handle, pin, PWM_FREQUENCY, duty)
-            self._current_duty[pin] = duty
+            return
+        pin = self._pins[index]
+        if current is None:
+            self._lgpio.gpio_claim_output(self._handle, pin)
+        # Map [-1, 1] → [5.0%, 10.0%] duty cycle (1 ms – 2 ms pulse at 50 Hz)
+        self._lgpio.tx_pwm(self._handle, pin, PWM_FREQUENCY, _DUTY_LUT[step + _THROTTLE_STEPS])
+        self._steps[index] = step
 
     def stop_all(self) -> None:
-        """Park all active motors at neutral (1500 µs) and release their pins."""
-        for pin in self._active_pins:
-            self._lgpio.tx_pwm(self._handle, pin, PWM_FREQUENCY, _DUTY_NEUTRAL)
-        self._active_pins.clear()
-        self._current_duty.clear()
+        """Park all active motors at neutral (1500 µs) and release their pins.
+
+        Pins already at neutral keep their waveform — no tx_pwm round-trip.
+        """
+        for pin, step in zip(self._pins, self._steps):
+            if step is not None and step != 0:
+                self._lgpio.tx_pwm(self._handle, pin, PWM_FREQUENCY, _DUTY_NEUTRAL)
+        self._steps = [None] * len(self._pins)
+
+
+def _noop(*args: object) -> None:
+    pass
 
 
 class NullMotors:
-    """No-op motor controller used when running without hardware."""
+    """No-op motor controller used when running without hardware.
 
-    def set_throttle(self, index: int, throttle: float) -> None:
-        pass
+    Methods are shared staticmethods, so calls skip bound-method creation.
+    """
 
-    def stop_all(self) -> None:
-        pass
+    __slots__ = ()
+
+    set_throttle = staticmethod(_noop)
+    stop_all = staticmethod(_noop)
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import errno
 import logging
+import socket
+import struct
 import subprocess
 
 log = logging.getLogger(__name__)
 
 INTERFACE = "eth0"
 
+# Linux ioctl requests (linux/sockios.h)
+_SIOCGIFADDR = 0x8915
+_SIOCGIFNETMASK = 0x891B
+
 
 def get_eth0_address() -> str | None:
     """Return the current IPv4 address of eth0 in CIDR form (e.g. '192.168.1.100/24'),
     or None if the interface is not found or has no address."""
+    try:
+        return _ioctl_address(INTERFACE)
+    except OSError as exc:
+        if exc.errno in (errno.ENODEV, errno.EADDRNOTAVAIL):
+            return None  # no such interface, or no IPv4 address on it
+    except ImportError:
+        pass  # no fcntl (dev machine?)
+    # Fall back to parsing `ip`
     try:
         result = subprocess.run(
             ["ip", "-4", "addr", "show", INTERFACE],
@@ -28,6 +43,19 @@ def get_eth0_address() -> str | None:
         return None
 
 
+def _ioctl_address(interface: str) -> str:
+    """Read an interface's IPv4 address and netmask straight from the kernel."""
+    import fcntl
+
+    ifreq = struct.pack("256s", interface.encode()[:15])
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        # struct ifreq: 16-byte name, then a sockaddr_in whose address is at offset 4
+        address = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, ifreq)[20:24]
+        netmask = fcntl.ioctl(sock.fileno(), _SIOCGIFNETMASK, ifreq)[20:24]
+    prefix = bin(int.from_bytes(netmask, "big")).count("1")
+    return f"{socket.inet_ntoa(address)}/{prefix}"
+
+
 def set_eth0_address(cidr: str) -> None:
     """Set a static IPv4 address on eth0 using nmcli.
 
@@ -14,7 +14,9 @@ Published topics:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
 
 from src.config import NT_IDENTITY
 from src.leds import Color
@@ -37,6 +39,13 @@ class NTClient:
         self._seconds_until_inactive_sub = None
         self._practice_color_sub = None
         self._motor_throttle_subs: list = []
+        self._publish_count: Callable[[int], None] | None = None  # bound in start()
+        # Latest value of each subscribed topic, kept current by NT listeners so
+        # the getters read a dict instead of calling into ntcore (see _cache_values)
+        self._values: dict[str, object] = {}
+        self._motor_throttles: list[float] = []
+        self._listeners: list[int] = []  # NT listener handles, removed on stop()
+        self._watches: list[Callable[[], list[int]]] = []  # re-registered on every start()
 
     def start(self, server_address: str, identity: str = NT_IDENTITY) -> None:
         import ntcore  # type: ignore[import]  # Pi/robot dependency
@@ -77,58 +86,164 @@ class NTClient:
             for i in range(len(MOTOR_PINS))
         ]
 
+        self._publish_count = self._count_pub.set
+
+        # Registered before the watches: listeners run in order on one ntcore
+        # thread, so the cache is current by the time a watch wakes the loop
+        self._listeners.extend(
+            self._cache_values(
+                self._values,
+                {
+                    "fms_mode": self._fms_mode_sub,
+                    "fms_control": self._fms_control_sub,
+                    "hub_active": self._hub_active_sub,
+                    "practice_hub_active": self._practice_hub_active_sub,
+                    "seconds_until_inactive": self._seconds_until_inactive_sub,
+                    "practice_color": self._practice_color_sub,
+                },
+            )
+        )
+        self._motor_throttles = [0.0] * len(self._motor_throttle_subs)
+        self._listeners.extend(
+            self._cache_values(self._motor_throttles, dict(enumerate(self._motor_throttle_subs)))
+        )
+        # Also on the listener thread, so a disconnect can't interleave with a value
+        self._listeners.append(self._inst.addConnectionListener(False, self._on_connection))
+
+        for register in self._watches:
+            self._listeners.extend(register())
+
+    def watch_practice(self, loop: asyncio.AbstractEventLoop, event: asyncio.Event) -> None:
+        """Set ``event`` whenever a robot_practice topic changes value.
+
+        NT listeners fire on an ntcore thread; the event is set on ``loop`` via
+        call_soon_threadsafe(). Watches survive stop()/start() cycles.
+        """
+        self._add_watch(
+            lambda: self._listen_values(
+                (
+                    self._fms_control_sub,
+                    self._practice_hub_active_sub,
+                    self._seconds_until_inactive_sub,
+                    self._practice_color_sub,
+                ),
+                loop,
+                event,
+            )
+        )
+
+    def watch_teleop(self, loop: asyncio.AbstractEventLoop, event: asyncio.Event) -> None:
+        """Set ``event`` whenever FMS/mode or HubTracker/isActive changes value."""
+        self._add_watch(
+            lambda: self._listen_values((self._fms_mode_sub, self._hub_active_sub), loop, event)
+        )
+
+    def watch_motors(self, loop: asyncio.AbstractEventLoop, event: asyncio.Event) -> None:
+        """Set ``event`` whenever a BearHub/motor{N}Throttle topic changes value."""
+        self._add_watch(
+            lambda: self._listen_values(tuple(self._motor_throttle_subs), loop, event)
+        )
+
+    def watch_connection(
+        self, loop: asyncio.AbstractEventLoop, on_change: Callable[[bool], None]
+    ) -> None:
+        """Call ``on_change(connected)`` on ``loop`` on each connect/disconnect."""
+
+        def register() -> list[int]:
+            import ntcore  # type: ignore[import]  # Pi/robot dependency
+
+            def on_event(event) -> None:  # noqa: ANN001
+                connected = event.is_(ntcore.EventFlags.kConnected)
+                loop.call_soon_threadsafe(on_change, connected)
+
+            return [self._inst.addConnectionListener(True, on_event)]
+
+        self._add_watch(register)
+
+    def _add_watch(self, register: Callable[[], list[int]]) -> None:
+        self._watches.append(register)
+        if self._inst is not None:
+            self._listeners.extend(register())
+
+    def _cache_values(self, values: dict | list, subs: dict) -> list[int]:
+        """Keep ``values[key]`` current for each ``key: subscription`` in ``subs``."""
+        import ntcore  # type: ignore[import]  # Pi/robot dependency
+
+        def cache(key: str | int) -> Callable[[object], None]:
+            def on_value(event) -> None:  # noqa: ANN001
+                values[key] = event.data.value.value()
+
+            return on_value
+
+        # kImmediate also delivers each topic's current value, if it has one
+        flags = ntcore.EventFlags.kValueAll | ntcore.EventFlags.kImmediate
+        return [self._inst.addListener(sub, flags, cache(key)) for key, sub in subs.items()]
+
+    def _on_connection(self, event) -> None:  # noqa: ANN001
+        import ntcore  # type: ignore[import]  # Pi/robot dependency
+
+        if not event.is_(ntcore.EventFlags.kConnected):
+            # Values from the lost server are stale: fall back to the subscriber defaults
+            self._values.clear()
+            self._motor_throttles[:] = [0.0] * len(self._motor_throttles)
+
+    def _listen_values(
+        self, subs: tuple, loop: asyncio.AbstractEventLoop, event: asyncio.Event
+    ) -> list[int]:
+        import ntcore  # type: ignore[import]  # Pi/robot dependency
+
+        def on_change(_event) -> None:  # noqa: ANN001
+            loop.call_soon_threadsafe(event.set)
+
+        return [self._inst.addListener(sub, ntcore.EventFlags.kValueAll, on_change) for sub in subs]
+
     def stop(self) -> None:
         if self._inst is not None:
+            for handle in self._listeners:
+                self._inst.removeListener(handle)
+            self._listeners.clear()
             self._inst.stopClient()
             self._inst = None
             self._motor_throttle_subs.clear()
+            self._values.clear()
+            self._motor_throttles = []
             log.info("NT4 client stopped")
 
     def publish_count(self, count: int) -> None:
-        if self._count_pub is not None:
-            self._count_pub.set(count)
+        publish = self._publish_count
+        if publish is not None:
+            publish(count)
 
     def get_seconds_until_inactive(self) -> float:
         """Return seconds until hub becomes inactive, or -1 if unavailable."""
-        if self._seconds_until_inactive_sub is None:
-            return -1.0
-        return float(self._seconds_until_inactive_sub.get())
+        return float(self._values.get("seconds_until_inactive", -1.0))
 
     def get_practice_hub_active(self) -> bool:
         """Return the hub active state from the robot's practice NT topic."""
-        if self._practice_hub_active_sub is None:
-            return False
-        return bool(self._practice_hub_active_sub.get())
+        return bool(self._values.get("practice_hub_active", False))
 
     def get_fms_control_data(self) -> int:
         """Return the raw FMSInfo/FMSControlData value (0 if unavailable)."""
-        if self._fms_control_sub is None:
-            return 0
-        return int(self._fms_control_sub.get())
+        return int(self._values.get("fms_control", 0))
 
     def get_fms_mode(self) -> str:
         """Return current FMS period: 'auto', 'teleop', or 'disabled'."""
-        if self._fms_mode_sub is None:
-            return "disabled"
-        return self._fms_mode_sub.get()
+        return self._values.get("fms_mode", "disabled")
 
     def get_hub_active(self) -> bool:
         """Return True when this hub's scoring cycle is active."""
-        if self._hub_active_sub is None:
-            return True
-        return self._hub_active_sub.get()
+        return self._values.get("hub_active", True)
 
     def get_motor_throttle(self, index: int) -> float:
         """Return motor throttle [-1.0, 1.0] published by the robot, or 0.0."""
-        if index >= len(self._motor_throttle_subs):
+        throttles = self._motor_throttles
+        if index >= len(throttles):
             return 0.0
-        return float(self._motor_throttle_subs[index].get())
+        return float(throttles[index])
 
     def get_practice_led_color(self) -> Color | None:
         """Return [r, g, b] color from robot in practice mode, or None."""
-        if self._practice_color_sub is None:
-            return None
-        arr = self._practice_color_sub.get()
+        arr = self._values.get("practice_color", ())
         if len(arr) >= 3:
             return Color(int(arr[0]), int(arr[1]), int(arr[2]))
         return None
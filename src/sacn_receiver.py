@@ -4,20 +4,25 @@ The FMS lighting system sends DMX512 data encapsulated in sACN packets.
 DMX channels 1–3 (R, G, B) set all LEDs to the same solid color.
 
 sacn.sACNreceiver() runs in its own thread; callbacks bridge into the
-asyncio event loop via loop.call_soon_threadsafe().
+asyncio event loop via loop.call_soon_threadsafe(). Only the newest colour is
+visible, so a burst of packets between loop iterations collapses into a single
+wakeup that delivers the latest colour.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import time
-
-import sacn  # type: ignore[import]
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
 
+from src.activity import ActivityMonitor
 from src.config import SACN_UNIVERSE
 from src.leds import Color
 
+if TYPE_CHECKING:
+    import sacn  # type: ignore[import]
+
 log = logging.getLogger(__name__)
 
 SACN_ACTIVE_TIMEOUT = 10.0  # seconds
@@ -28,14 +33,24 @@ class SACNReceiver:
         self._receiver: sacn.sACNreceiver | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._led_queue: asyncio.Queue[Color] | None = None
-        self._last_packet_time: float = 0.0
+        self._latest: Sequence[int] = (0, 0, 0)  # newest RGB received, not yet delivered
+        self._deliver_scheduled = False
+        self._activity = ActivityMonitor(SACN_ACTIVE_TIMEOUT)
 
     @property
     def is_active(self) -> bool:
-        """True if a packet was received within the last 10 seconds."""
-        return (time.monotonic() - self._last_packet_time) < SACN_ACTIVE_TIMEOUT
+        """True while packets are arriving (as last reported to the watcher)."""
+        return self._activity.active
+
+    def watch_active(
+        self, loop: asyncio.AbstractEventLoop, on_change: Callable[[bool], None]
+    ) -> None:
+        """Call ``on_change(active)`` on ``loop`` whenever is_active flips."""
+        self._activity.watch(loop, on_change)
 
     def start(self, loop: asyncio.AbstractEventLoop, led_queue: asyncio.Queue[Color]) -> None:
+        import sacn  # type: ignore[import]  # only needed in fms mode
+
         log.info("Starting sACN receiver on universe %d", SACN_UNIVERSE)
         self._loop = loop
         self._led_queue = led_queue
@@ -44,13 +59,25 @@ class SACNReceiver:
         self._receiver.start()
 
     def _on_packet(self, packet) -> None:  # noqa: ANN001
-        self._last_packet_time = time.monotonic()
-        data = packet.dmxData
-        r = data[0] if len(data) >= 1 else 0
-        g = data[1] if len(data) >= 2 else 0
-        b = data[2] if len(data) >= 3 else 0
+        self._activity.notify()
         if self._loop and self._led_queue:
-            self._loop.call_soon_threadsafe(self._led_queue.put_nowait, Color(r, g, b))
+            # Channels 1–3 in one slice; missing channels of a short packet read as 0
+            rgb = packet.dmxData[:3]
+            if len(rgb) < 3:
+                rgb = (*rgb, 0, 0, 0)[:3]
+            self._latest = rgb
+            if not self._deliver_scheduled:
+                self._deliver_scheduled = True
+                self._loop.call_soon_threadsafe(self._deliver_latest)
+
+    def _deliver_latest(self) -> None:
+        """Hand the newest colour to the LED queue (runs on the event loop).
+
+        The Color is built here, once per delivery, rather than once per packet.
+        """
+        # Clear the flag first so a packet racing with us schedules a new delivery
+        self._deliver_scheduled = False
+        self._led_queue.put_nowait(Color._make(self._latest))
 
     def stop(self) -> None:
         if self._receiver is not None:
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
 import logging
+import math
+import time
+import zlib
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated, Literal
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, StringConstraints
+
+from src.network import get_eth0_address, set_eth0_address
 
 if TYPE_CHECKING:
     from src.app import App
@@ -22,7 +33,42 @@ app_instance: App | None = None
 app = FastAPI(title="BearHub")
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
-_connections: list[WebSocket] = []
+_connections: set[WebSocket] = set()
+
+BROADCAST_BATCH_SIZE = 50  # concurrent sends per batch; the loop is yielded between batches
+SEND_TIMEOUT_S = 1.0  # a client that cannot take a frame within this is dropped
+
+_PONG = b"pong"  # keepalive reply, allocated once
+
+STATUS_CACHE_CONTROL = "max-age=1, must-revalidate"  # GET /api/status is revalidated by ETag
+ETH0_CACHE_TTL_S = 2.0  # GET /api/network/eth0 reuses a read this recent
+_eth0_cache: tuple[float, str | None] = (-math.inf, None)  # (monotonic read time, address)
+
+
+# ---------------------------------------------------------------------------
+# Request bodies — parsed and validated by pydantic before the handler runs
+# ---------------------------------------------------------------------------
+
+
+class AddressBody(BaseModel):
+    address: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+class SpeedBody(BaseModel):
+    speed: float
+
+
+class ModeBody(BaseModel):
+    mode: Literal["fms", "demo", "robot_teleop", "robot_practice"]
+
+
+@app.exception_handler(RequestValidationError)
+async def invalid_body(request: Request, exc: RequestValidationError) -> JSONResponse:
+    """Report an invalid body in the {"success": false, "error": ...} shape the UI reads."""
+    error = exc.errors()[0]
+    field = ".".join(str(part) for part in error["loc"] if part != "body")
+    message = f"{field}: {error['msg']}" if field else error["msg"]
+    return JSONResponse({"success": False, "error": message}, status_code=422)
 
 
 # ---------------------------------------------------------------------------
@@ -30,77 +76,86 @@ _connections: list[WebSocket] = []
 # ---------------------------------------------------------------------------
 
 
+# Pages are read and gzip-compressed once at import — they do not change while
+# the server runs. Each entry is (plain, gzipped).
+_PAGES: dict[str, tuple[bytes, bytes]] = {}
+for _name in ("index", "admin", "debug"):
+    _html = (STATIC_DIR / f"{_name}.html").read_bytes()
+    _PAGES[_name] = (_html, gzip.compress(_html, compresslevel=9, mtime=0))
+
+
+def _page(request: Request, name: str) -> HTMLResponse:
+    """Serve a cached page, gzipped when the client accepts it."""
+    html, gzipped = _PAGES[name]
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=gzipped, headers=headers)
+    return HTMLResponse(content=html, headers=headers)
+
+
 @app.get("/", response_class=HTMLResponse)
-async def dashboard() -> HTMLResponse:
-    html = (STATIC_DIR / "index.html").read_text()
-    return HTMLResponse(content=html)
+async def dashboard(request: Request) -> HTMLResponse:
+    return _page(request, "index")
 
 
 @app.get("/admin", response_class=HTMLResponse)
-async def admin() -> HTMLResponse:
-    html = (STATIC_DIR / "admin.html").read_text()
-    return HTMLResponse(content=html)
+async def admin(request: Request) -> HTMLResponse:
+    return _page(request, "admin")
 
 
 @app.get("/debug", response_class=HTMLResponse)
-async def debug() -> HTMLResponse:
-    html = (STATIC_DIR / "debug.html").read_text()
-    return HTMLResponse(content=html)
+async def debug(request: Request) -> HTMLResponse:
+    return _page(request, "debug")
 
 
 @app.get("/api/status")
-async def get_status() -> dict:
+async def get_status(request: Request) -> Response:
+    # Encoded directly: a plain dict return would go through FastAPI's response
+    # validation and jsonable_encoder before being serialized
     if app_instance is None:
-        return {}
-    s = app_instance.state
-    return {
-        "mode": s.mode,
-        "active_count": s.active_count,
-        "auto_count": s.auto_count,
-        "inactive_count": s.inactive_count,
-        "nt_connected": s.nt_connected,
-        "modbus_active": s.modbus_active,
-        "hub_name": app_instance.hub.name,
-        "simulator_enabled": s.simulator_enabled,
-        "nt_server_address": s.nt_server_address,
-        "sacn_active": s.sacn_active,
-        "fms_period": s.fms_period,
-        "seconds_until_inactive": s.seconds_until_inactive,
-        "motors_running": s.motors_running,
-        "motor_speed": s.motor_speed,
-        "led_color": "#{:02x}{:02x}{:02x}".format(*s.led_color),
-    }
+        return Response(content="{}", media_type="application/json")
+    content = encode_message(_state_data(app_instance))
+    # The ETag is a checksum of the body, so a poller whose copy is current gets
+    # a bodiless 304
+    headers = {"ETag": f'W/"{zlib.crc32(content):08x}"', "Cache-Control": STATUS_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @app.get("/api/network/eth0")
 async def get_eth0() -> dict:
-    from src.network import get_eth0_address
-    address = get_eth0_address()
+    global _eth0_cache
+    read_at, address = _eth0_cache
+    now = time.monotonic()
+    if now - read_at >= ETH0_CACHE_TTL_S:
+        # Off the loop: without SIOCGIFADDR this falls back to running `ip`
+        address = await asyncio.to_thread(get_eth0_address)
+        _eth0_cache = (now, address)
     default = app_instance.hub.default_eth0_address if app_instance else None
     return {"address": address, "default": default}
 
 
 @app.post("/api/network/eth0")
-async def set_eth0(body: dict) -> dict:
-    from src.network import set_eth0_address
-    cidr = body.get("address", "").strip()
-    if not cidr:
-        return {"success": False, "error": "Address is required"}
+async def set_eth0(body: AddressBody) -> dict:
+    global _eth0_cache
+    cidr = body.address
     try:
-        set_eth0_address(cidr)
+        await asyncio.to_thread(set_eth0_address, cidr)  # several nmcli runs
     except RuntimeError as exc:
         log.warning("Failed to set eth0 address: %s", exc)
         return {"success": False, "error": str(exc)}
+    finally:
+        _eth0_cache = (-math.inf, None)  # next read sees the new address
     return {"success": True, "address": cidr}
 
 
 @app.post("/api/nt-address")
-async def set_nt_address(body: dict) -> dict:
+async def set_nt_address(body: AddressBody) -> dict:
     if app_instance is None:
         return {"success": False}
-    address = body.get("address", "").strip()
-    if not address:
-        return {"success": False, "error": "Address is required"}
+    address = body.address
     await app_instance.set_nt_server_address(address)
     return {"success": True, "address": address}
 
@@ -122,14 +177,10 @@ async def simulate_toggle() -> dict:
 
 
 @app.post("/api/motors/speed")
-async def motors_speed(body: dict) -> dict:
+async def motors_speed(body: SpeedBody) -> dict:
     if app_instance is None:
         return {"success": False}
-    try:
-        speed = float(body["speed"])
-    except (KeyError, ValueError):
-        return {"success": False, "error": "invalid speed"}
-    await app_instance.set_motor_speed(speed)
+    await app_instance.set_motor_speed(body.speed)
     return {"success": True, "motor_speed": app_instance.state.motor_speed}
 
 
@@ -138,7 +189,7 @@ async def simulate_ball() -> dict:
     """Inject one simulated ball event — dev/test only."""
     if app_instance is None:
         return {"success": False}
-    await app_instance._ball_queue.put(0)
+    app_instance._ball_queue.put_nowait(0)  # unbounded, so this never blocks
     return {"success": True}
 
 
@@ -151,13 +202,10 @@ async def reset_counts() -> dict:
 
 
 @app.post("/api/mode")
-async def set_mode(body: dict) -> dict:
+async def set_mode(body: ModeBody) -> dict:
     if app_instance is None:
         return {"success": False}
-    mode = body.get("mode", "")
-    valid = {"fms", "demo", "robot_teleop", "robot_practice"}
-    if mode not in valid:
-        return {"success": False, "error": f"Invalid mode: {mode}"}
+    mode = body.mode
     try:
         await app_instance.set_mode(mode)
     except Exception as exc:
@@ -174,57 +222,99 @@ async def set_mode(body: dict) -> dict:
 @app.websocket("/api/ws")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     await websocket.accept()
-    _connections.append(websocket)
+    _connections.add(websocket)
     log.debug("WS client connected (total: %d)", len(_connections))
 
     # Send current state on connect
     if app_instance is not None:
-        await websocket.send_json(_build_state_message(app_instance))
+        await websocket.send_bytes(app_instance.current_state_frame())
 
     try:
         while True:
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_text("pong")
+                await websocket.send_bytes(_PONG)
     except WebSocketDisconnect:
         pass
     finally:
-        if websocket in _connections:
-            _connections.remove(websocket)
+        _connections.discard(websocket)
         log.debug("WS client disconnected (total: %d)", len(_connections))
 
 
+def encode_message(message: dict) -> bytes:
+    """Encode a message as compact UTF-8 JSON — the one encoder for HTTP and WebSocket.
+
+    WebSocket frames are sent as these bytes, so a broadcast is UTF-8 encoded
+    once rather than once per client by send_text().
+    """
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode()
+
+
 async def broadcast(message: dict) -> None:
     """Broadcast a JSON message to all connected WebSocket clients."""
-    dead: list[WebSocket] = []
-    for ws in list(_connections):
-        try:
-            await ws.send_json(message)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        if ws in _connections:
-            _connections.remove(ws)
+    await broadcast_bytes(encode_message(message))
+
+
+async def broadcast_bytes(frame: bytes) -> None:
+    """Broadcast an already-encoded JSON message to all connected WebSocket clients.
+
+    Clients are sent to concurrently, so one slow client delays the broadcast by
+    at most SEND_TIMEOUT_S instead of stalling every client queued behind it.
+    Clients whose send fails or times out are dropped and closed.
+    """
+    # Snapshot, since the set may change while sends are awaited
+    connections = tuple(_connections)
+    for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        batch = connections[start : start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(_send_bytes(ws, frame) for ws in batch), return_exceptions=True
+        )
+        failed = [ws for ws, result in zip(batch, results) if isinstance(result, Exception)]
+        if failed:
+            _connections.difference_update(failed)
+            await asyncio.gather(*(_close(ws) for ws in failed), return_exceptions=True)
+
+
+async def _send_bytes(ws: WebSocket, frame: bytes) -> None:
+    async with asyncio.timeout(SEND_TIMEOUT_S):
+        await ws.send_bytes(frame)
+
+
+async def _close(ws: WebSocket) -> None:
+    """Close a client dropped from a broadcast so the dashboard reconnects."""
+    async with asyncio.timeout(SEND_TIMEOUT_S):
+        await ws.close(code=1011)
 
 
 def _build_state_message(a: App) -> dict:
+    return {"type": "state", "data": _state_data(a)}
+
+
+def _state_data(a: App) -> dict:
+    """The dashboard state — one schema for GET /api/status and WebSocket frames."""
     s = a.state
     return {
-        "type": "state",
-        "data": {
-            "mode": s.mode,
-            "active_count": s.active_count,
-            "auto_count": s.auto_count,
-            "inactive_count": s.inactive_count,
-            "nt_connected": s.nt_connected,
-            "modbus_active": s.modbus_active,
-            "hub_name": a.hub.name,
-            "simulator_enabled": s.simulator_enabled,
-            "nt_server_address": s.nt_server_address,
-            "sacn_active": s.sacn_active,
-            "fms_period": s.fms_period,
-            "seconds_until_inactive": s.seconds_until_inactive,
-            "motors_running": s.motors_running,
-            "led_color": "#{:02x}{:02x}{:02x}".format(*s.led_color),
-        },
+        "mode": s.mode,
+        "active_count": s.active_count,
+        "auto_count": s.auto_count,
+        "inactive_count": s.inactive_count,
+        "nt_connected": s.nt_connected,
+        "modbus_active": s.modbus_active,
+        "hub_name": a.hub.name,
+        "simulator_enabled": s.simulator_enabled,
+        "nt_server_address": s.nt_server_address,
+        "sacn_active": s.sacn_active,
+        "fms_period": s.fms_period,
+        "seconds_until_inactive": s.seconds_until_inactive,
+        "motors_running": s.motors_running,
+        "motor_speed": s.motor_speed,
+        "led_color": _led_hex(s.led_color),
     }
+
+
+@lru_cache(maxsize=64)
+def _led_hex(color: tuple[int, int, int]) -> str:
+    """'#rrggbb' for an LED colour — memoized, the strip only shows a few colours."""
+    return "#%02x%02x%02x" % color
@@ -126,6 +126,7 @@ class BearHubApp {
         this.ws = null;
         this.reconnectTimer = null;
         this.keepaliveTimer = null;
+        this.decoder = new TextDecoder();
         this.previousActive = 0;
         this.milestonesFired = new Set(); // 'energized' | 'supercharged'
         this.isInitialState = true; // suppress animations on first state message
@@ -151,6 +152,7 @@ class BearHubApp {
     connectWebSocket() {
         const proto = location.protocol === 'https:' ? 'wss:' : 'ws:';
         this.ws = new WebSocket(`${proto}//${location.host}/api/ws`);
+        this.ws.binaryType = 'arraybuffer';  // frames are UTF-8 JSON bytes
 
         this.ws.onopen = () => {
             console.log('WS connected');
@@ -159,9 +161,10 @@ class BearHubApp {
         };
 
         this.ws.onmessage = (evt) => {
-            if (evt.data === 'pong') return;
+            const text = this.decoder.decode(evt.data);
+            if (text === 'pong') return;
             try {
-                const msg = JSON.parse(evt.data);
+                const msg = JSON.parse(text);
                 if (msg.type === 'state') this.updateState(msg.data);
             } catch (e) {
                 console.error('WS parse error', e);
@@ -0,0 +1,47 @@
+"""Tests for ActivityMonitor — active/idle transitions from notify() calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.activity import ActivityMonitor
+
+
+class TestActivityMonitor:
+    @pytest.mark.asyncio
+    async def test_reports_active_then_idle_once(self):
+        changes: list[bool] = []
+        monitor = ActivityMonitor(0.05)
+        monitor.watch(asyncio.get_running_loop(), changes.append)
+
+        for _ in range(3):
+            monitor.notify()
+        await asyncio.sleep(0)
+        assert changes == [True]
+        assert monitor.active
+
+        await asyncio.sleep(0.1)
+        assert changes == [True, False]
+        assert not monitor.active
+
+    @pytest.mark.asyncio
+    async def test_activity_during_timeout_extends_active_period(self):
+        changes: list[bool] = []
+        monitor = ActivityMonitor(0.05)
+        monitor.watch(asyncio.get_running_loop(), changes.append)
+
+        monitor.notify()
+        await asyncio.sleep(0.03)
+        monitor.notify()
+        await asyncio.sleep(0.04)  # past the first deadline, within the second
+        assert changes == [True]
+
+        await asyncio.sleep(0.06)
+        assert changes == [True, False]
+
+    def test_notify_without_watcher_is_noop(self):
+        monitor = ActivityMonitor(1.0)
+        monitor.notify()  # must not raise
+        assert not monitor.active
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -150,6 +151,112 @@ async def test_teleop_hub_inactive_increments_inactive_only():
     assert app.state.inactive_count == 1
 
 
+@pytest.mark.asyncio
+async def test_process_balls_exits_promptly_on_shutdown():
+    app = _make_app()
+
+    task = asyncio.create_task(app._process_balls())
+    await asyncio.sleep(0)
+    await app.shutdown()
+
+    await asyncio.wait_for(task, timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_demo_ball_burst_extends_a_single_flash():
+    app = _make_app()
+    app.state.mode = "demo"
+    app._leds = MagicMock()
+
+    for _ in range(3):
+        await app._ball_queue.put(0)
+
+    with (
+        patch("src.web.server.broadcast_bytes", new_callable=AsyncMock),
+        patch("src.app.DEMO_FLASH_S", 0.05),
+    ):
+        balls = asyncio.create_task(app._process_balls())
+        flasher = asyncio.create_task(app._demo_flasher())
+        await asyncio.sleep(0.01)
+
+        assert app.state.led_color == RED_HUB.led_idle_color
+        app._leds.set_all.assert_called_once()
+        app._leds.clear.assert_not_called()
+
+        await asyncio.sleep(0.08)
+
+        await _force_cancel(balls)
+        await _force_cancel(flasher)
+
+    assert app.state.led_color == (0, 0, 0)
+    app._leds.set_all.assert_called_once()
+    app._leds.clear.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_queued_balls_are_scored_as_one_batch():
+    app = _make_app()
+
+    for channel in (0, 1, 2, 3):
+        await app._ball_queue.put(channel)
+
+    with patch("src.app.App._handle_balls", new_callable=AsyncMock) as handle:
+        task = asyncio.create_task(app._process_balls())
+        await asyncio.sleep(0)
+        await _force_cancel(task)
+
+    handle.assert_awaited_once_with([0, 1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_single_ball_channel_frames_are_encoded_once_per_channel():
+    app = _make_app()
+
+    with (
+        patch("src.web.server.broadcast_bytes", new_callable=AsyncMock) as send,
+        patch("src.web.server.encode_message", wraps=json.dumps) as encode,
+    ):
+        await app._handle_balls([1])
+        await app._handle_balls([1])
+
+    assert encode.call_count == 1
+    assert [json.loads(c.args[0]) for c in send.await_args_list] == [
+        {"type": "ball_channel", "channels": [1]}
+    ] * 2
+
+
+@pytest.mark.asyncio
+async def test_ball_burst_is_broadcast_as_one_channel_frame():
+    app = _make_app()
+
+    with patch("src.web.server.broadcast_bytes", new_callable=AsyncMock) as send:
+        await app._handle_balls([0, 2, 2])
+
+    send.assert_awaited_once()
+    assert json.loads(send.await_args.args[0]) == {"type": "ball_channel", "channels": [0, 2, 2]}
+
+
+@pytest.mark.asyncio
+async def test_process_leds_shows_only_newest_color():
+    from src.leds import Color
+
+    app = _make_app()
+    app._leds = MagicMock()
+
+    for color in (Color(1, 0, 0), Color(2, 0, 0), Color(3, 0, 0)):
+        await app._led_queue.put(color)
+
+    task = asyncio.create_task(app._process_leds())
+    await asyncio.sleep(0)
+    await app._led_queue.put(Color(3, 0, 0))  # unchanged colour — no SPI write
+    await asyncio.sleep(0)
+    await _force_cancel(task)
+
+    app._leds.set_all.assert_called_once_with(Color(3, 0, 0))
+    app._leds.show.assert_called_once()
+    assert app.state.led_color == (3, 0, 0)
+
+
 # ── Mode transitions ─────────────────────────────────────────────────────────
 
 
@@ -173,10 +280,47 @@ async def test_set_mode_noop_when_same():
     app = _make_app()
     app.state.mode = "demo"
 
-    with patch("src.app.App._broadcast_state", new_callable=AsyncMock) as bc:
-        await app.set_mode("demo")
+    await app.set_mode("demo")
+
+    assert not app._dirty.is_set()
 
-    bc.assert_not_called()
+
+# ── State broadcast coalescing ───────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_burst_of_state_changes_coalesces_into_one_broadcast():
+    app = _make_app()
+    app.state.mode = "demo"
+
+    for _ in range(5):
+        await app._ball_queue.put(0)
+
+    with (
+        patch("src.app.App._broadcast_state", new_callable=AsyncMock) as bc,
+        patch("src.web.server.broadcast_bytes", new_callable=AsyncMock),
+    ):
+        balls = asyncio.create_task(app._process_balls())
+        broadcaster = asyncio.create_task(app._broadcaster())
+        await asyncio.sleep(0.05)
+        await _force_cancel(balls)
+        await _force_cancel(broadcaster)
+
+    assert app.state.active_count == 5
+    assert bc.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_state_skips_unchanged_state():
+    app = _make_app()
+
+    with patch("src.web.server.broadcast_bytes", new_callable=AsyncMock) as send:
+        await app._broadcast_state()
+        await app._broadcast_state()
+        app.state.active_count += 1
+        await app._broadcast_state()
+
+    assert send.await_count == 2
 
 
 # ── Reset counts ─────────────────────────────────────────────────────────────
@@ -197,6 +341,25 @@ async def test_reset_counts_zeroes_all_counts():
     assert app.state.inactive_count == 0
 
 
+# ── Score LEDs ───────────────────────────────────────────────────────────────
+
+
+def test_update_score_leds_uses_threshold_colors():
+    from src.config import THRESHOLD_ENERGIZED, THRESHOLD_SUPERCHARGED
+    from src.leds import Color
+
+    app = _make_app()
+    app._leds = MagicMock()
+
+    app._update_score_leds(0)
+    app._leds.set_all.assert_called_with(Color(*RED_HUB.led_idle_color))
+    app._update_score_leds(THRESHOLD_ENERGIZED)
+    app._leds.set_all.assert_called_with(Color(255, 179, 0))
+    app._update_score_leds(THRESHOLD_SUPERCHARGED)
+    app._leds.set_all.assert_called_with(Color(0, 207, 255))
+    assert app.state.led_color == (0, 207, 255)
+
+
 # ── Modbus / NT publish ──────────────────────────────────────────────────────
 
 
@@ -214,6 +377,8 @@ async def test_fms_mode_writes_to_modbus():
         await asyncio.sleep(0)
         await _force_cancel(task)
 
+    assert app._counts_dirty.is_set()
+    app._publish_counts()
     app._modbus.set_ball_count.assert_called_with(RED_HUB.modbus_ball_count_register, 1)
 
 
@@ -231,6 +396,8 @@ async def test_robot_teleop_mode_publishes_to_nt():
         await asyncio.sleep(0)
         await _force_cancel(task)
 
+    assert app._counts_dirty.is_set()
+    app._publish_counts()
     app._nt.publish_count.assert_called_with(1)
 
 
@@ -251,9 +418,31 @@ async def test_fms_mode_modbus_total_includes_inactive():
     # active=0, inactive=1 → Modbus should receive 1, not 0
     assert app.state.inactive_count == 1
     assert app.state.active_count == 0
+    assert app._counts_dirty.is_set()
+    app._publish_counts()
     app._modbus.set_ball_count.assert_called_with(RED_HUB.modbus_ball_count_register, 1)
 
 
+@pytest.mark.asyncio
+async def test_fms_ball_burst_writes_modbus_once():
+    app = _make_app()
+    app.state.mode = "fms"
+    app.state.fms_period = "teleop"
+    app.state.hub_is_active = True
+
+    for _ in range(5):
+        await app._ball_queue.put(0)
+
+    with patch("src.web.server.broadcast_bytes", new_callable=AsyncMock):
+        balls = asyncio.create_task(app._process_balls())
+        publisher = asyncio.create_task(app._count_publisher())
+        await asyncio.sleep(0.1)
+        await _force_cancel(balls)
+        await _force_cancel(publisher)
+
+    app._modbus.set_ball_count.assert_called_once_with(RED_HUB.modbus_ball_count_register, 5)
+
+
 # ── robot_practice ball categorization ──────────────────────────────────────
 
 
@@ -307,7 +496,7 @@ async def test_practice_teleop_hub_inactive_increments_inactive():
     assert app.state.inactive_count == 1
 
 
-# ── robot_practice grace periods (via _status_poll) ─────────────────────────
+# ── robot_practice grace periods (via _practice_led_task) ──────────────────
 
 
 @pytest.mark.asyncio
@@ -322,8 +511,8 @@ async def test_practice_auto_grace_period_holds_fms_period():
     app._auto_grace_until = time.monotonic() + 10.0      # grace active
 
     with patch("src.app.App._broadcast_state", new_callable=AsyncMock):
-        task = asyncio.create_task(app._status_poll())
-        await asyncio.sleep(1.1)
+        task = asyncio.create_task(app._practice_led_task())
+        await asyncio.sleep(0.1)
         task.cancel()
         try:
             await task
@@ -345,8 +534,8 @@ async def test_practice_hub_grace_period_holds_hub_active():
     app._hub_grace_until = time.monotonic() + 10.0       # grace active
 
     with patch("src.app.App._broadcast_state", new_callable=AsyncMock):
-        task = asyncio.create_task(app._status_poll())
-        await asyncio.sleep(1.1)
+        task = asyncio.create_task(app._practice_led_task())
+        await asyncio.sleep(0.1)
         task.cancel()
         try:
             await task
@@ -356,15 +545,165 @@ async def test_practice_hub_grace_period_holds_hub_active():
     assert app.state.hub_is_active is True
 
 
+@pytest.mark.asyncio
+async def test_practice_led_task_sleeps_until_triggered():
+    """Outside robot_practice the task does not poll NT; a trigger wakes it."""
+    app = _make_app()
+    app.state.mode = "demo"
+
+    task = asyncio.create_task(app._practice_led_task())
+    await asyncio.sleep(0.05)
+    app._nt.get_fms_control_data.assert_not_called()
+
+    app._nt.get_fms_control_data.return_value = 35  # auto
+    app.state.mode = "robot_practice"
+    app._practice_trigger.set()
+    await asyncio.sleep(0.01)
+    await _force_cancel(task)
+
+    assert app.state.fms_period == "auto"
+
+
+@pytest.mark.asyncio
+async def test_practice_countdown_stored_as_whole_seconds():
+    """seconds_until_inactive holds the displayed whole-second countdown."""
+    app = _make_app()
+    app.state.mode = "robot_practice"
+    app._nt.get_fms_control_data.return_value = 0
+    app._nt.get_practice_hub_active.return_value = False
+    app._nt.get_seconds_until_inactive.return_value = 12.4
+
+    task = asyncio.create_task(app._practice_led_task())
+    await asyncio.sleep(0.01)
+    assert app.state.seconds_until_inactive == 13
+
+    app.state.mode = "demo"
+    app._practice_trigger.set()
+    await asyncio.sleep(0.01)
+    await _force_cancel(task)
+
+    assert app.state.seconds_until_inactive == -1
+
+
+def _practice_teleop_app(seconds_left: float):
+    """An app in robot_practice teleop with the hub active and mocked LEDs."""
+    app = _make_app()
+    app.state.mode = "robot_practice"
+    app._nt.get_fms_control_data.return_value = 33  # teleop
+    app._nt.get_practice_hub_active.return_value = True
+    app._nt.get_seconds_until_inactive.return_value = seconds_left
+    app._leds = MagicMock()
+    return app
+
+
+@pytest.mark.asyncio
+async def test_practice_blink_toggles_on_its_cadence_not_on_nt_updates():
+    """NT updates inside one 250 ms blink interval do not flip the blink."""
+    app = _practice_teleop_app(seconds_left=2.5)
+    idle = app._color_idle
+
+    task = asyncio.create_task(app._practice_led_task())
+    await asyncio.sleep(0)
+    app._leds.set_all.assert_called_once_with(idle)  # blink starts lit
+
+    for _ in range(3):  # countdown updates arriving well within 250 ms
+        await asyncio.sleep(0.02)
+        app._practice_trigger.set()
+    await asyncio.sleep(0.02)
+    app._leds.set_all.assert_called_once()
+
+    await asyncio.sleep(0.2)  # past the 250 ms toggle
+    await _force_cancel(task)
+
+    assert app._leds.set_all.call_count == 2
+    assert app._leds.set_all.call_args.args[0] == app._color_off
+    assert app.state.led_color == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_practice_leds_written_only_when_colour_changes():
+    app = _practice_teleop_app(seconds_left=20.0)
+
+    task = asyncio.create_task(app._practice_led_task())
+    await asyncio.sleep(0)
+    for _ in range(5):
+        app._practice_trigger.set()
+        await asyncio.sleep(0)
+    await _force_cancel(task)
+
+    app._leds.set_all.assert_called_once_with(app._color_idle)
+    app._leds.show.assert_called_once()
+
+
+# ── Status tracking ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_teleop_status_task_mirrors_nt_on_trigger():
+    app = _make_app()
+    app.state.mode = "robot_teleop"
+
+    task = asyncio.create_task(app._teleop_status_task())
+    await asyncio.sleep(0)
+    assert app.state.fms_period == "disabled"
+
+    app._nt.get_fms_mode.return_value = "teleop"
+    app._nt.get_hub_active.return_value = False
+    app._teleop_trigger.set()
+    await asyncio.sleep(0)
+    await _force_cancel(task)
+
+    assert app.state.fms_period == "teleop"
+    assert app.state.hub_is_active is False
+    assert app._dirty.is_set()
+
+
+def test_nt_connection_ignored_outside_robot_modes():
+    app = _make_app()
+    app.state.mode = "demo"
+    app._on_nt_connection(True)
+    assert app.state.nt_connected is False
+
+    app.state.mode = "robot_teleop"
+    app._on_nt_connection(True)
+    assert app.state.nt_connected is True
+
+
+@pytest.mark.asyncio
+async def test_nt_disconnect_stops_nt_driven_motors(mock_ntcore):
+    from src.nt_client import NTClient
+
+    app = _make_app()
+    app.state.mode = "robot_teleop"
+    app._motors = MagicMock()
+    app._nt = nt = NTClient()
+    nt.start("10.40.68.2")
+    for call in mock_ntcore.addListener.call_args_list[-len(nt._motor_throttles) :]:
+        call.args[2](MagicMock(**{"data.value.value.return_value": 0.5}))
+
+    task = asyncio.create_task(app._motor_poll())
+    await asyncio.sleep(0)
+    app._motors.set_throttle.assert_any_call(0, 0.5)
+
+    disconnected = MagicMock(**{"is_.return_value": False})
+    mock_ntcore.addConnectionListener.call_args.args[1](disconnected)
+    app._on_nt_connection(False)
+    await asyncio.sleep(0)
+    await _force_cancel(task)
+
+    assert nt.get_motor_throttle(0) == 0.0
+    for i in range(len(nt._motor_throttles)):
+        app._motors.set_throttle.assert_any_call(i, 0.0)
+
+
 # ── Motor polling (FMS coil control) ─────────────────────────────────────────
 
 
 async def _run_motor_poll_once(app) -> None:
-    """Let _motor_poll execute one full iteration then cancel it.
+    """Let _motor_poll execute its first pass then cancel it.
 
-    _motor_poll starts with asyncio.sleep(0.05); waiting 60 ms guarantees the
-    first logic pass runs before the task is cancelled.  asyncio.sleep is
-    properly cancellable so a single task.cancel() is sufficient here.
+    _motor_poll applies the throttles before its first wait on _motor_trigger,
+    which is properly cancellable, so a single task.cancel() is sufficient here.
     """
     task = asyncio.create_task(app._motor_poll())
     await asyncio.sleep(0.06)
@@ -459,3 +798,97 @@ async def test_non_fms_mode_motors_idle():
     mock_motors.set_throttle.assert_any_call(0, 0.0)
     mock_motors.set_throttle.assert_any_call(1, 0.0)
     app._modbus.get_coil.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_motor_poll_skips_unchanged_throttles():
+    """Repeated idle wakeups write the neutral throttle once, not on every wakeup."""
+    app = _make_app()
+    app.state.mode = "demo"
+    mock_motors = MagicMock()
+    app._motors = mock_motors
+
+    task = asyncio.create_task(app._motor_poll())
+    await asyncio.sleep(0)
+    for _ in range(3):
+        app._motor_trigger.set()
+        await asyncio.sleep(0)
+    assert mock_motors.set_throttle.call_count == 2
+
+    await app.toggle_motors()
+    await asyncio.sleep(0)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    assert mock_motors.set_throttle.call_count == 4
+    mock_motors.set_throttle.assert_called_with(1, app.state.motor_speed)
+
+
+@pytest.mark.asyncio
+async def test_motor_poll_waits_for_trigger_between_passes():
+    """Coil changes are only read when the trigger (or the heartbeat) wakes the poll."""
+    app = _make_app()
+    app.state.mode = "fms"
+    app._motors = MagicMock()
+    coils = {0: False, 1: True}
+    app._modbus.get_coil = MagicMock(side_effect=lambda addr: coils.get(addr, False))
+
+    task = asyncio.create_task(app._motor_poll())
+    await asyncio.sleep(0.06)
+    reads = app._modbus.get_coil.call_count
+
+    coils[0] = True
+    await asyncio.sleep(0.06)
+    assert app._modbus.get_coil.call_count == reads  # no trigger, no poll
+
+    app._motor_trigger.set()
+    await asyncio.sleep(0)
+    await _force_cancel(task)
+
+    app._motors.set_throttle.assert_called_with(1, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_current_state_frame_reuses_last_broadcast():
+    app = _make_app()
+    fresh = json.loads(app.current_state_frame())
+    assert fresh["type"] == "state"
+    assert fresh["data"]["mode"] == "demo"
+
+    with patch("src.web.server.broadcast_bytes", new_callable=AsyncMock) as send:
+        await app._broadcast_state()
+
+    assert app.current_state_frame() is send.await_args.args[0]
+
+
+# ── Persistence ──────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_save_state_is_coalesced_and_written_atomically(tmp_path):
+    state_file = tmp_path / "state.json"
+    app = _make_app()
+
+    with (
+        patch("src.app.STATE_FILE", str(state_file)),
+        patch("src.app.STATE_SAVE_COALESCE_S", 0.01),
+    ):
+        app.state.mode = "fms"
+        app._save_state()
+        app.state.motor_speed = 0.5
+        app._save_state()
+        assert not state_file.exists()  # nothing written on the event loop
+
+        writer = asyncio.create_task(app._state_writer())
+        await asyncio.sleep(0.1)
+        await _force_cancel(writer)
+
+        loaded = _make_app()
+        loaded._load_state()
+
+    assert not state_file.with_suffix(".tmp").exists()
+    assert loaded.state.mode == "fms"
+    assert loaded.state.motor_speed == 0.5
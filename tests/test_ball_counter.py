@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -93,7 +94,24 @@ class TestBallCounter:
 
         # Rising edge then falling edge after rearm window — should count
         counter._on_edge(chip=0, gpio=23, level=1, tick=0)
-        counter._last_count_time[23] = time.monotonic() - (BALL_REARM_MS / 1000.0) - 0.001
+        counter._last_count_ns[0] = time.monotonic_ns() - (BALL_REARM_MS + 1) * 1_000_000
         counter._on_edge(chip=0, gpio=23, level=0, tick=0)
         await asyncio.sleep(0)
         assert queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_burst_of_edges_schedules_single_drain(self, mock_lgpio):
+        from src.ball_counter import BallCounter
+
+        counter = BallCounter(pins=[23, 24, 25, 16])
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        counter.start(loop, queue)
+
+        with patch.object(loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe) as cst:
+            for pin in (23, 24, 25, 16):
+                counter._on_edge(chip=0, gpio=pin, level=0, tick=0)
+            await asyncio.sleep(0)
+
+        assert cst.call_count == 1
+        assert [queue.get_nowait() for _ in range(4)] == [0, 1, 2, 3]
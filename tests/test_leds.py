@@ -15,22 +15,37 @@ class TestNullLedStrip:
         strip.show()
         strip.clear()
         strip.set_brightness(0.5)
+        strip.close()
 
 
 class TestLedStrip:
-    def test_preamble_is_42_zero_bytes(self, mock_spidev):
+    def test_preamble_is_zero_bytes(self, mock_spidev):
         from src.leds import LedStrip
 
         strip = LedStrip(led_count=1)
-        assert strip._buffer[: LedStrip.PREAMBLE].sum() == 0
-        assert len(strip._buffer) == LedStrip.PREAMBLE + 1 * 24
+        assert strip._buffers[0][: LedStrip.PREAMBLE].sum() == 0
+        assert len(strip._buffers[0]) == LedStrip.PREAMBLE + 1 * 24
+        assert LedStrip.PREAMBLE % 8 == 0
 
     def test_buffer_length_scales_with_led_count(self, mock_spidev):
         from src.leds import LedStrip
 
         for n in (1, 10, 300):
             strip = LedStrip(led_count=n)
-            assert len(strip._buffer) == LedStrip.PREAMBLE + n * 24
+            assert len(strip._buffers[0]) == LedStrip.PREAMBLE + n * 24
+
+    def test_warns_when_spidev_bufsiz_splits_a_frame(self, mock_spidev, tmp_path, caplog):
+        from unittest.mock import patch
+
+        from src import leds
+
+        bufsiz = tmp_path / "bufsiz"
+        bufsiz.write_text("4096\n")
+        with patch.object(leds, "SPIDEV_BUFSIZ_PATH", bufsiz):
+            leds.LedStrip(led_count=100)  # 48 + 2400 bytes fits
+            assert "bufsiz" not in caplog.text
+            leds.LedStrip(led_count=300)  # 48 + 7200 bytes does not
+        assert "spidev.bufsiz=8192" in caplog.text
 
     def test_show_sends_grb_byte_order(self, mock_spidev):
         from src.leds import LedStrip
@@ -38,6 +53,7 @@ class TestLedStrip:
         strip = LedStrip(led_count=1)
         strip.set_pixel_color(0, Color(r=255, g=0, b=0))
         strip.show()
+        strip.flush()
 
         # The SPI device writebytes2 should have been called
         mock_spidev.writebytes2.assert_called()
@@ -59,9 +75,20 @@ class TestLedStrip:
 
         strip = LedStrip(led_count=4)
         strip.clear()
+        strip.flush()
 
         mock_spidev.writebytes2.assert_called_with(strip._clear_buffer)
 
+    def test_clear_buffer_is_shared_per_length_and_read_only(self, mock_spidev):
+        from src.leds import LedStrip
+
+        a, b = LedStrip(led_count=4), LedStrip(led_count=4)
+        assert a._clear_buffer is b._clear_buffer
+        assert LedStrip(led_count=5)._clear_buffer is not a._clear_buffer
+        assert not a._clear_buffer.flags.writeable
+        assert a._clear_buffer[: LedStrip.PREAMBLE].sum() == 0
+        assert (a._clear_buffer[LedStrip.PREAMBLE :] == LedStrip.LED_ZERO).all()
+
     def test_set_brightness_clamps_to_unit_interval(self, mock_spidev):
         from src.leds import LedStrip
 
@@ -82,6 +109,7 @@ class TestLedStrip:
         strip.set_brightness(0.0)
         strip.set_pixel_color(0, Color(255, 255, 255))
         strip.show()
+        strip.flush()
 
         buf = np.array(mock_spidev.writebytes2.call_args[0][0], dtype=np.uint8)
         pixel_start = LedStrip.PREAMBLE
@@ -93,3 +121,77 @@ class TestLedStrip:
 
         assert LedStrip.LED_ONE == 0b1111_1100
         assert LedStrip.LED_ZERO == 0b1100_0000
+
+    def test_bit_lut_matches_per_bit_encoding(self):
+        from src.leds import LedStrip
+
+        table = LedStrip._BIT_LUT64.view(np.uint8).reshape(256, 8)
+        for byte in range(256):
+            expected = [
+                LedStrip.LED_ONE if byte >> bit & 1 else LedStrip.LED_ZERO
+                for bit in range(7, -1, -1)
+            ]
+            assert table[byte].tolist() == expected
+
+    def test_partial_brightness_matches_truncated_scaling(self, mock_spidev):
+        from src.leds import LedStrip
+
+        strip = LedStrip(led_count=2)
+        strip.set_brightness(0.5)
+        strip.set_pixel_color(0, Color(255, 100, 3))
+        strip.set_pixel_color(1, Color(1, 2, 201))
+        strip.show()
+        strip.flush()
+
+        buf = np.array(mock_spidev.writebytes2.call_args[0][0], dtype=np.uint8)
+        bits = buf[LedStrip.PREAMBLE :] == LedStrip.LED_ONE
+        grb = np.packbits(bits).reshape(2, 3)
+        assert grb.tolist() == [[50, 127, 1], [1, 0, 100]]
+
+    def test_show_reencodes_only_changed_pixels(self, mock_spidev):
+        from src.leds import LedStrip
+
+        strip = LedStrip(led_count=3)
+        strip.set_all(Color(0, 0, 0))
+        strip.show()
+        strip.flush()
+
+        strip.set_pixel_color(1, Color(255, 255, 255))
+        strip.show()
+        strip.flush()
+        buf = np.array(mock_spidev.writebytes2.call_args[0][0], dtype=np.uint8)
+        pixels = buf[LedStrip.PREAMBLE :].reshape(3, 24)
+        assert (pixels[0] == LedStrip.LED_ZERO).all()
+        assert (pixels[1] == LedStrip.LED_ONE).all()
+        assert (pixels[2] == LedStrip.LED_ZERO).all()
+
+        # Third frame lands back in the first buffer and re-encodes only rows 1–2
+        strip.set_pixel_color(2, Color(255, 255, 255))
+        strip.show()
+        strip.flush()
+        buf = np.array(mock_spidev.writebytes2.call_args[0][0], dtype=np.uint8)
+        pixels = buf[LedStrip.PREAMBLE :].reshape(3, 24)
+        assert (pixels[0] == LedStrip.LED_ZERO).all()
+        assert (pixels[1:] == LedStrip.LED_ONE).all()
+
+        # A brightness change re-encodes every pixel, even unchanged ones
+        strip.set_brightness(0.0)
+        strip.show()
+        strip.flush()
+        buf = np.array(mock_spidev.writebytes2.call_args[0][0], dtype=np.uint8)
+        assert (buf[LedStrip.PREAMBLE :] == LedStrip.LED_ZERO).all()
+
+    def test_show_alternates_buffers_and_close_sends_pending(self, mock_spidev):
+        from src.leds import LedStrip
+
+        strip = LedStrip(led_count=2)
+        strip.show()
+        strip.show()
+        strip.clear()
+        strip.close()
+
+        sent = [c.args[0] for c in mock_spidev.writebytes2.call_args_list]
+        assert sent[0] is strip._buffers[0]
+        assert sent[1] is strip._buffers[1]
+        assert sent[2] is strip._clear_buffer
+        assert not strip._writer.is_alive()
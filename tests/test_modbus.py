@@ -2,35 +2,58 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
 
+import pytest
+
+from src.config import MODBUS_UNIT_ID
 from src.modbus import ModbusServer, _TrackedHoldingRegisters
 
 
 class TestTrackedHoldingRegisters:
-    def test_last_read_time_starts_at_zero(self):
+    def test_read_count_starts_at_zero(self):
         block = _TrackedHoldingRegisters(0, [0] * 10)
-        assert block.last_read_time == 0.0
+        assert block.read_count == 0
 
-    def test_get_values_stamps_monotonic_time(self):
+    def test_get_values_counts_reads(self):
         block = _TrackedHoldingRegisters(0, [0] * 10)
-        before = time.monotonic()
         block.getValues(0, 1)
-        after = time.monotonic()
-        assert before <= block.last_read_time <= after
+        block.getValues(0, 1)
+        assert block.read_count == 2
 
     def test_get_values_returns_correct_data(self):
         block = _TrackedHoldingRegisters(0, [42, 7, 99])
         assert block.getValues(0, 1) == [42]
         assert block.getValues(1, 2) == [7, 99]
 
-    def test_each_call_updates_time(self):
+    def test_get_values_out_of_range_is_illegal_address(self):
+        from pymodbus.constants import ExcCodes  # type: ignore[import]
+
+        block = _TrackedHoldingRegisters(1, [42, 7])
+        assert block.getValues(1, 1) == [42]
+        assert block.getValues(0, 1) == ExcCodes.ILLEGAL_ADDRESS
+        assert block.getValues(3, 1) == ExcCodes.ILLEGAL_ADDRESS
+
+    def test_get_values_calls_on_read(self):
         block = _TrackedHoldingRegisters(0, [0] * 10)
+        reads: list[None] = []
+        block.on_read = lambda: reads.append(None)
         block.getValues(0, 1)
-        first = block.last_read_time
-        time.sleep(0.01)
-        block.getValues(0, 1)
-        assert block.last_read_time > first
+        assert reads == [None]
+
+
+class TestModbusServerCoils:
+    @pytest.mark.asyncio
+    async def test_plc_coil_write_calls_watcher(self):
+        server = ModbusServer()
+        writes: list[None] = []
+        server.watch_coils(asyncio.get_running_loop(), lambda: writes.append(None))
+
+        server._context[MODBUS_UNIT_ID].setValues(5, 0, [True])  # fc 5: write single coil
+        await asyncio.sleep(0)
+
+        assert writes == [None]
+        assert server.get_coil(0) is True
 
 
 class TestModbusServerIsPlcActive:
@@ -38,14 +61,17 @@ class TestModbusServerIsPlcActive:
         server = ModbusServer()
         assert not server.is_plc_active
 
-    def test_is_plc_active_true_after_recent_read(self):
+    @pytest.mark.asyncio
+    async def test_is_plc_active_follows_reads(self):
         server = ModbusServer()
-        server._hr.last_read_time = time.monotonic()
+        server.watch_plc_active(asyncio.get_running_loop(), lambda active: None)
+        server._plc_activity._tick = 0.01  # shorten the 1 s timeout for the test
+
+        server._hr.getValues(0, 1)
+        await asyncio.sleep(0)
         assert server.is_plc_active
 
-    def test_is_plc_active_false_when_stale(self):
-        server = ModbusServer()
-        server._hr.last_read_time = time.monotonic() - 2.0  # 2s ago > 1s timeout
+        await asyncio.sleep(0.08)
         assert not server.is_plc_active
 
     def test_set_ball_count_does_not_trigger_is_plc_active(self):
@@ -53,3 +79,21 @@ class TestModbusServerIsPlcActive:
         server = ModbusServer()
         server.set_ball_count(0, 42)
         assert not server.is_plc_active
+
+    def test_set_ball_count_is_what_the_plc_reads(self):
+        server = ModbusServer()
+        server.set_ball_count(0, 42)
+        server.set_ball_count(1, 7)
+        assert server._context[MODBUS_UNIT_ID].getValues(3, 0, count=2) == [42, 7]
+
+    @pytest.mark.asyncio
+    async def test_plc_read_reports_active_transition(self):
+        server = ModbusServer()
+        changes: list[bool] = []
+        server.watch_plc_active(asyncio.get_running_loop(), changes.append)
+
+        server._hr.getValues(0, 1)
+        server._hr.getValues(0, 1)
+        await asyncio.sleep(0)
+
+        assert changes == [True]
@@ -49,6 +49,15 @@ class TestMotors:
         motors.set_throttle(0, 0.5)
         mock_lgpio.tx_pwm.assert_not_called()
 
+    def test_tx_pwm_not_called_for_change_below_throttle_resolution(self, mock_lgpio):
+        from src.motors import Motors
+
+        motors = Motors(pins=[12, 13])
+        motors.set_throttle(0, 0.5)
+        mock_lgpio.tx_pwm.reset_mock()
+        motors.set_throttle(0, 0.5002)  # rounds to the same 0.1% step
+        mock_lgpio.tx_pwm.assert_not_called()
+
     def test_tx_pwm_called_when_duty_changes(self, mock_lgpio):
         from src.motors import Motors
 
@@ -118,6 +127,18 @@ class TestMotors:
         assert calls[12] == _DUTY_NEUTRAL
         assert calls[13] == _DUTY_NEUTRAL
 
+    def test_stop_all_skips_pins_already_at_neutral(self, mock_lgpio):
+        from src.motors import Motors
+
+        motors = Motors(pins=[12, 13])
+        motors.set_throttle(0, 0.0)
+        motors.set_throttle(1, 0.5)
+
+        mock_lgpio.tx_pwm.reset_mock()
+        motors.stop_all()
+
+        mock_lgpio.tx_pwm.assert_called_once_with(99, 13, PWM_FREQUENCY, _DUTY_NEUTRAL)
+
     def test_stop_all_clears_active_pins(self, mock_lgpio):
         from src.motors import Motors
 
@@ -0,0 +1,127 @@
+"""Tests for NTClient — practice-topic change listeners."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from src.nt_client import NTClient
+
+
+class TestNTClientPracticeListeners:
+    def test_watch_before_start_registers_on_start(self, mock_ntcore):
+        NTClient().start("10.40.68.2")
+        cache_listeners = mock_ntcore.addListener.call_count
+        mock_ntcore.addListener.reset_mock()
+
+        client = NTClient()
+        loop = asyncio.new_event_loop()
+        client.watch_practice(loop, asyncio.Event())
+        mock_ntcore.addListener.assert_not_called()
+
+        client.start("10.40.68.2")
+
+        assert mock_ntcore.addListener.call_count == cache_listeners + 4
+        loop.close()
+
+    def test_stop_removes_listeners(self, mock_ntcore):
+        handles = itertools.count(1)
+        mock_ntcore.addListener.side_effect = handles
+        mock_ntcore.addConnectionListener.side_effect = handles
+        client = NTClient()
+        loop = asyncio.new_event_loop()
+        client.watch_practice(loop, asyncio.Event())
+        client.start("10.40.68.2")
+        added = mock_ntcore.addListener.call_count + mock_ntcore.addConnectionListener.call_count
+        client.stop()
+
+        removed = [call.args[0] for call in mock_ntcore.removeListener.call_args_list]
+        assert removed == list(range(1, added + 1))
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_value_change_sets_event(self, mock_ntcore):
+        client = NTClient()
+        event = asyncio.Event()
+        client.start("10.40.68.2")
+        client.watch_practice(asyncio.get_running_loop(), event)
+
+        callback = mock_ntcore.addListener.call_args.args[2]
+        callback(object())  # as if fired from the ntcore listener thread
+        await asyncio.sleep(0)
+
+        assert event.is_set()
+
+
+class TestNTClientMotorListeners:
+    @pytest.mark.asyncio
+    async def test_throttle_change_sets_event(self, mock_ntcore):
+        client = NTClient()
+        event = asyncio.Event()
+        client.start("10.40.68.2")
+        listeners = mock_ntcore.addListener.call_count
+        client.watch_motors(asyncio.get_running_loop(), event)
+
+        assert mock_ntcore.addListener.call_count == listeners + len(client._motor_throttle_subs)
+        mock_ntcore.addListener.call_args.args[2](object())
+        await asyncio.sleep(0)
+
+        assert event.is_set()
+
+
+def _value_event(value):
+    """A stand-in for the ntcore.Event passed to a value listener."""
+    return SimpleNamespace(data=SimpleNamespace(value=SimpleNamespace(value=lambda: value)))
+
+
+class TestNTClientGetters:
+    def test_getters_return_defaults_before_start(self):
+        client = NTClient()
+        assert client.get_fms_mode() == "disabled"
+        assert client.get_fms_control_data() == 0
+        assert client.get_hub_active() is True
+        assert client.get_practice_hub_active() is False
+        assert client.get_seconds_until_inactive() == -1.0
+        assert client.get_practice_led_color() is None
+        assert client.get_motor_throttle(0) == 0.0
+        client.publish_count(3)  # must not raise
+
+    def test_getters_return_values_delivered_to_listeners(self, mock_ntcore):
+        client = NTClient()
+        client.start("10.40.68.2")
+        # Cache listeners are registered first: the six topics in order, then motors
+        callbacks = [call.args[2] for call in mock_ntcore.addListener.call_args_list]
+
+        callbacks[1](_value_event(35))           # FMSInfo/FMSControlData
+        callbacks[5](_value_event([1, 2, 3]))    # HubPractice/ledColor
+        callbacks[7](_value_event(0.5))          # BearHub/motor1Throttle
+
+        assert client.get_fms_control_data() == 35
+        assert client.get_practice_led_color() == (1, 2, 3)
+        assert client.get_motor_throttle(1) == 0.5
+        assert client.get_motor_throttle(0) == 0.0
+        client._fms_control_sub.get.assert_not_called()
+
+        client.publish_count(7)
+        client._count_pub.set.assert_called_once_with(7)
+
+        client.stop()
+        assert client.get_fms_control_data() == 0
+
+    def test_disconnect_resets_values_to_defaults(self, mock_ntcore):
+        client = NTClient()
+        client.start("10.40.68.2")
+        callbacks = [call.args[2] for call in mock_ntcore.addListener.call_args_list]
+        callbacks[0](_value_event("teleop"))     # FMSInfo/mode
+        callbacks[7](_value_event(0.5))          # BearHub/motor1Throttle
+        on_connection = mock_ntcore.addConnectionListener.call_args.args[1]
+
+        on_connection(SimpleNamespace(is_=lambda _flag: True))
+        assert client.get_motor_throttle(1) == 0.5
+
+        on_connection(SimpleNamespace(is_=lambda _flag: False))
+        assert client.get_fms_mode() == "disabled"
+        assert client.get_motor_throttle(1) == 0.0
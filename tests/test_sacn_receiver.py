@@ -103,3 +103,21 @@ class TestSACNReceiver:
 
         await asyncio.sleep(0)
         assert queue.get_nowait() == Color(0, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_packet_burst_delivers_only_latest_color(self, mock_sacn):
+        from src.sacn_receiver import SACNReceiver
+
+        receiver = SACNReceiver()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Color] = asyncio.Queue()
+        receiver.start(loop, queue)
+
+        for value in (10, 20, 30):
+            packet = MagicMock()
+            packet.dmxData = [value, 0, 0]
+            receiver._on_packet(packet)
+
+        await asyncio.sleep(0)
+        assert queue.get_nowait() == Color(30, 0, 0)
+        assert queue.empty()
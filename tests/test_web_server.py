@@ -0,0 +1,269 @@
+"""Tests for the web server — WebSocket broadcast fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.web import server
+
+
+def _client(send_bytes=None) -> AsyncMock:
+    ws = AsyncMock()
+    if send_bytes is not None:
+        ws.send_bytes.side_effect = send_bytes
+    return ws
+
+
+class TestBroadcast:
+    @pytest.mark.asyncio
+    async def test_sends_frame_to_every_client(self):
+        clients = [_client() for _ in range(3)]
+        with patch.object(server, "_connections", set(clients)):
+            await server.broadcast_bytes(b'{"type":"state"}')
+
+        for ws in clients:
+            ws.send_bytes.assert_awaited_once_with(b'{"type":"state"}')
+
+    @pytest.mark.asyncio
+    async def test_failed_client_is_dropped(self):
+        good = _client()
+        bad = _client(send_bytes=RuntimeError("closed"))
+        connections = {bad, good}
+        with patch.object(server, "_connections", connections):
+            await server.broadcast_bytes(b"{}")
+
+        assert connections == {good}
+        good.send_bytes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others_and_is_dropped(self):
+        async def hang(_frame: bytes) -> None:
+            await asyncio.sleep(10)
+
+        fast = _client()
+        slow = _client(send_bytes=hang)
+        connections = {slow, fast}
+        with (
+            patch.object(server, "_connections", connections),
+            patch.object(server, "SEND_TIMEOUT_S", 0.05),
+        ):
+            await asyncio.wait_for(server.broadcast_bytes(b"{}"), timeout=1.0)
+
+        fast.send_bytes.assert_awaited_once()
+        assert connections == {fast}
+
+    @pytest.mark.asyncio
+    async def test_timed_out_client_is_closed(self):
+        async def hang(*_args, **_kwargs) -> None:
+            await asyncio.sleep(10)
+
+        fast = _client()
+        slow = _client(send_bytes=hang)
+        slow.close.side_effect = hang  # a stalled socket may not close cleanly either
+        with (
+            patch.object(server, "_connections", {slow, fast}),
+            patch.object(server, "SEND_TIMEOUT_S", 0.05),
+        ):
+            await asyncio.wait_for(server.broadcast_bytes(b"{}"), timeout=1.0)
+
+        slow.close.assert_awaited_once()
+        fast.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_large_fan_out_is_sent_in_batches(self):
+        clients = [_client() for _ in range(5)]
+        with (
+            patch.object(server, "_connections", set(clients)),
+            patch.object(server, "BROADCAST_BATCH_SIZE", 2),
+            patch("src.web.server.asyncio.sleep", new_callable=AsyncMock) as yield_,
+        ):
+            await server.broadcast_bytes(b"{}")
+
+        assert yield_.await_count == 2  # between the three batches
+        for ws in clients:
+            ws.send_bytes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_connecting_mid_broadcast_is_not_sent_the_frame(self):
+        late = _client()
+        connections: set = set()
+
+        async def connect_late(_frame: bytes) -> None:
+            connections.add(late)
+
+        connections.add(_client(send_bytes=connect_late))
+        with patch.object(server, "_connections", connections):
+            await server.broadcast_bytes(b"{}")
+
+        late.send_bytes.assert_not_awaited()
+        assert late in connections
+
+
+class TestPages:
+    def test_pages_are_served_from_memory(self):
+        from fastapi.testclient import TestClient
+
+        client = TestClient(server.app)
+        with patch("pathlib.Path.read_text", side_effect=AssertionError("disk read")):
+            for path, name in (("/", "index"), ("/admin", "admin"), ("/debug", "debug")):
+                response = client.get(path)
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/html")
+                assert response.content == (server.STATIC_DIR / f"{name}.html").read_bytes()
+
+    def test_pages_are_gzipped_only_when_accepted(self):
+        from fastapi.testclient import TestClient
+
+        client = TestClient(server.app)
+        html = (server.STATIC_DIR / "index.html").read_bytes()
+
+        gzipped = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.content == html  # decoded by the client
+
+        plain = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.content == html
+
+
+class TestSetMode:
+    @pytest.mark.parametrize("mode", ["bogus", "", ["fms"], None])
+    def test_invalid_mode_is_rejected_without_switching(self, mode):
+        from fastapi.testclient import TestClient
+
+        app = AsyncMock()
+        with patch.object(server, "app_instance", app):
+            response = TestClient(server.app).post("/api/mode", json={"mode": mode})
+
+        assert response.json()["success"] is False
+        app.set_mode.assert_not_awaited()
+
+    def test_valid_mode_switches(self):
+        from fastapi.testclient import TestClient
+
+        app = AsyncMock()
+        with patch.object(server, "app_instance", app):
+            response = TestClient(server.app).post("/api/mode", json={"mode": "robot_teleop"})
+
+        assert response.json() == {"success": True, "mode": "robot_teleop"}
+        app.set_mode.assert_awaited_once_with("robot_teleop")
+
+
+class TestRequestBodies:
+    def test_address_is_stripped(self):
+        from fastapi.testclient import TestClient
+
+        app = AsyncMock()
+        with patch.object(server, "app_instance", app):
+            response = TestClient(server.app).post(
+                "/api/nt-address", json={"address": "  10.40.68.2 "}
+            )
+
+        assert response.json() == {"success": True, "address": "10.40.68.2"}
+        app.set_nt_server_address.assert_awaited_once_with("10.40.68.2")
+
+    @pytest.mark.parametrize(
+        ("path", "body"),
+        [
+            ("/api/nt-address", {"address": "   "}),
+            ("/api/nt-address", {}),
+            ("/api/motors/speed", {"speed": "fast"}),
+        ],
+    )
+    def test_invalid_body_reports_error_in_ui_shape(self, path, body):
+        from fastapi.testclient import TestClient
+
+        with patch.object(server, "app_instance", AsyncMock()):
+            response = TestClient(server.app).post(path, json=body)
+
+        assert response.status_code == 422
+        assert response.json()["success"] is False
+        assert response.json()["error"]
+
+
+class TestWebSocket:
+    def test_ping_is_answered_with_pong_bytes(self):
+        from fastapi.testclient import TestClient
+
+        with (
+            patch.object(server, "app_instance", None),
+            TestClient(server.app).websocket_connect("/api/ws") as ws,
+        ):
+            ws.send_text("ping")
+            assert ws.receive_bytes() == b"pong"
+
+
+class TestEth0:
+    def test_address_read_is_cached_and_invalidated_by_set(self):
+        from fastapi.testclient import TestClient
+
+        client = TestClient(server.app)
+        with (
+            patch.object(server, "app_instance", None),
+            patch.object(server, "_eth0_cache", (float("-inf"), None)),
+            patch.object(server, "get_eth0_address", return_value="10.0.0.2/24") as read,
+            patch.object(server, "set_eth0_address") as write,
+        ):
+            assert client.get("/api/network/eth0").json()["address"] == "10.0.0.2/24"
+            client.get("/api/network/eth0")
+            assert read.call_count == 1
+
+            client.post("/api/network/eth0", json={"address": "10.0.0.3/24"})
+            write.assert_called_once_with("10.0.0.3/24")
+            client.get("/api/network/eth0")
+            assert read.call_count == 2
+
+
+class TestStatus:
+    def test_status_and_state_frames_share_one_schema(self):
+        from fastapi.testclient import TestClient
+
+        from src.app import AppState
+
+        app = AsyncMock()
+        app.state = AppState(motor_speed=0.5, led_color=(255, 0, 16))
+        app.hub.name = "red"
+        with patch.object(server, "app_instance", app):
+            status = TestClient(server.app).get("/api/status").json()
+
+        assert status == server._build_state_message(app)["data"]
+        assert status["motor_speed"] == 0.5
+        assert status["led_color"] == "#ff0010"
+
+    def test_unchanged_status_is_revalidated_with_304(self):
+        from fastapi.testclient import TestClient
+
+        from src.app import AppState
+
+        client = TestClient(server.app)
+        app = AsyncMock()
+        app.state = AppState()
+        app.hub.name = "red"
+        with patch.object(server, "app_instance", app):
+            first = client.get("/api/status")
+            etag = first.headers["etag"]
+            again = client.get("/api/status", headers={"If-None-Match": etag})
+            app.state.active_count = 1
+            changed = client.get("/api/status", headers={"If-None-Match": etag})
+
+        assert again.status_code == 304
+        assert again.content == b""
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["active_count"] == 1
+
+
+class TestSimulateBall:
+    def test_ball_is_queued_on_channel_zero(self):
+        from fastapi.testclient import TestClient
+
+        app = AsyncMock()
+        app._ball_queue = asyncio.Queue()
+        with patch.object(server, "app_instance", app):
+            response = TestClient(server.app).post("/api/simulate/ball")
+
+        assert response.json() == {"success": True}
+        assert app._ball_queue.get_nowait() == 0
@@ -13,6 +13,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import queue
 import signal
 import sys
 import time
@@ -49,28 +50,34 @@ def main() -> None:
 
     pins: list[int] = args.pins
     rearm_ms: int = args.rearm
-    counts: dict[int, int] = {i: 0 for i in range(len(pins))}
-    beam_broken: dict[int, bool] = {}
-    last_count_time: dict[int, float] = {}
+    rearm_ns = rearm_ms * 1_000_000
+    pin_to_channel: dict[int, int] = {pin: i for i, pin in enumerate(pins)}
+    # Per-channel state, indexed via pin_to_channel — same layout as BallCounter
+    counts: list[int] = [0] * len(pins)
+    beam_broken: list[bool] = [False] * len(pins)  # True while beam is interrupted
+    last_count_ns: list[int] = [0] * len(pins)  # monotonic_ns of last count
+
+    detections: queue.SimpleQueue[tuple[float, int, int, int]] = queue.SimpleQueue()
 
     handle = lgpio.gpiochip_open(0)
 
     def on_edge(chip: int, gpio: int, level: int, tick: int) -> None:
+        # Callbacks are only registered for pins, so every gpio has a channel
+        ch = pin_to_channel[gpio]
         if level != 0:  # rising edge — beam restored, re-arm
-            beam_broken[gpio] = False
+            beam_broken[ch] = False
             return
         # falling edge — beam broken
-        if beam_broken.get(gpio, False):
+        if beam_broken[ch]:
             return  # sustained low, ignore
-        now = time.monotonic()
-        if (now - last_count_time.get(gpio, 0.0)) * 1000 < rearm_ms:
+        now = time.monotonic_ns()
+        if now - last_count_ns[ch] < rearm_ns:
             return  # sensor pulsed again too soon (entry + exit pulse), ignore
-        beam_broken[gpio] = True
-        last_count_time[gpio] = now
-        ch = pins.index(gpio) if gpio in pins else gpio
+        beam_broken[ch] = True
+        last_count_ns[ch] = now
         counts[ch] += 1
-        ts = time.strftime("%H:%M:%S")
-        print(f"[{ts}]  Ball detected — channel {ch}  (GPIO {gpio})  total ch{ch}: {counts[ch]}")
+        # Formatting and stdout happen on the main thread, not in the edge callback
+        detections.put((time.time(), ch, gpio, counts[ch]))
 
     callbacks = []
     for pin in pins:
@@ -98,8 +105,11 @@ def main() -> None:
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    # Block forever — lgpio callbacks run in their own thread
-    signal.pause()
+    # lgpio callbacks run in their own thread; print what they detect until a signal
+    while True:
+        detected_at, ch, gpio, total = detections.get()
+        ts = time.strftime("%H:%M:%S", time.localtime(detected_at))
+        print(f"[{ts}]  Ball detected — channel {ch}  (GPIO {gpio})  total ch{ch}: {total}")
 
 
 if __name__ == "__main__":